@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import datetime
 
+import grading
+
 hide = """
         <style>
         #MainMenu {visibility: hidden;}
@@ -47,4 +49,19 @@ with col5:
     credit_1 = st.text_input('Credit',key="5")
     credit_2 = st.text_input('Credit1',key="6",label_visibility="collapsed")
 
+journal = pd.DataFrame({
+    "Date": [date_1, date_2],
+    "Account": [account_1, account_2],
+    "Debit": [debit_1, debit_2],
+    "Credit": [credit_1, credit_2],
+})
+
+if st.button("Check answer"):
+    grade = grading.KEYS["accrued_electricity"].grade(journal)
+    if grade.passed:
+        st.success("These are the correct adjusting entries!")
+    else:
+        line, field = grade.mistakes()[0]
+        st.error(f"Check the {field} of line {line + 1}.")
+
 st.write("Notes: Auto-complete account names and randomization to be added")
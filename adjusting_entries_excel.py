@@ -2,6 +2,9 @@ import streamlit as st
 import pandas as pd
 from mitosheet.streamlit.v1 import spreadsheet
 
+import grading
+import workbooks
+
 st.set_page_config(layout="wide")
 
 col1, col2 = st.columns([2,3])
@@ -17,50 +20,54 @@ with col1:
     Prepare the adjusting entries needed at August 31, 2025.
     """)
 
+    # Workbooks in the data folder can also be opened here.
+    imported = workbooks.sheet_picker()
+
 
-CHECKS_AND_ERRORS = [
-    (
-        lambda df: df.iloc[0,0] != 'Salaries and Wages Expense',
+ANSWER_KEY = grading.KEYS["accrued_salaries"]
+
+# Prompt for the first (line, field) of the journal that does not match the key.
+PROMPTS = {
+    (0, "account"): (
         'Enter the account name for the adjusted entry being debited in Cell A2.',
         'You can do this by clicking the cell under Account name. Enclose the account name in double quotations and make sure that Edit entire column is set to Off.'
     ),
 
-    (
-        lambda df: df.iloc[0,1] != 800,
+    (0, "debit"): (
         'Enter the amount for the adjusted entry being debited in Cell B2.',
         'You can do this by clicking the cell under Debit. Type =, then the amount and make sure that Edit entire column is set to Off.'
     ),
 
-    (
-        lambda df: df.iloc[1,0] != 'Salaries and Wages Payable',
+    (1, "account"): (
         'Enter the account name for the adjusted entry being credited in Cell A3.',
         'Enclose the account name in double quotations and make sure that Edit entire column is set to Off.'
     ),
 
-    (
-        lambda df: df.iloc[1,2] != 800,
+    (1, "credit"): (
         'Enter the amount for the adjusted entry being credited in Cell C3.',
         'Make sure that Edit entire column is set to Off.'
     )
-]
+}
 
 with col2:
     def run_data_checks_and_display_prompts(df):
         """
         Runs the data checks and displays prompts for the user to fix the data.
         """
-        for check, error_message, help in CHECKS_AND_ERRORS:
-            if check(df):
-                st.error(error_message + " " + help)
-                return False
+        grade = ANSWER_KEY.grade(df)
+        mistakes = grade.mistakes()
+        if mistakes:
+            line, field = mistakes[0]
+            error_message, help = PROMPTS.get(mistakes[0], (f'Check the {field} of line {line + 1}.', 'It should be left blank.'))
+            st.error(error_message + " " + help)
+            return False
+        if grade.extra_lines:
+            st.error('Delete the rows below the two adjusting entries.')
+            return False
         return True
 
-    @st.cache_data
-    def convert_df(df):
-        return df.to_csv(index=False).encode('utf-8')
-
     # Display the data inside of the spreadsheet so the user can easily fix data quality issues.
-    dfs, _ = spreadsheet(import_folder='./data')
+    dfs, _ = spreadsheet(*imported, import_folder='./data')
 
     # If the user has not yet imported data, prompt them to do so.
     if len(dfs) == 0:
@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import datasets
+import figures
+import plots
 
 hide = """
         <style>
@@ -17,7 +18,7 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-country = pd.read_csv("country_complete.csv")
+country = datasets.load_country_complete()
 
 # st.header("Visualizing the tips dataset")
 
@@ -26,11 +27,7 @@ col1, col2 = st.columns([1,3])
 with col1:
     categorical = st.selectbox(
         "Categorical feature",
-        [
-            "Continent",
-            "Internet access",
-            "Emissions range"
-        ]
+        plots.COUNTRY_CATEGORICAL
     )
 
     counts = country[["Country",categorical]].groupby(categorical).count()
@@ -38,9 +35,4 @@ with col1:
     st.dataframe(counts)
 
 with col2:
-    fig, ax = plt.subplots()
-
-    sns.histplot(x=categorical, data=country, shrink=.8)
-    ax.set_xlabel(categorical, fontsize=14)
-    ax.set_ylabel("Count", fontsize=14)
-    st.pyplot(fig)
+    figures.show(plots.country_bar, "country_complete", categorical)
@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import figures
+import plots
+import summaries
 
 hide = """
         <style>
@@ -17,8 +18,6 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-country = pd.read_csv("country_complete.csv")
-
 
 tab1, tab2 = st.tabs(["Plot", "Summary statistics"])
 
@@ -28,61 +27,26 @@ with tab1:
     with col1:
         plot = st.selectbox(
             "Plot",
-            [
-                "Box plot",
-                "Density plot",
-                "Histogram"
-            ]
+            plots.DISTRIBUTION_PLOTS
         )
 
         numerical = st.selectbox(
             "Numerical feature",
-            [
-                "Years",
-                "Fertility",
-                "Emissions",
-                "Internet"
-            ]
+            plots.COUNTRY_NUMERICAL
         )
 
         continent = st.selectbox(
             "Continent",
-            [
-                "Africa",
-                "Americas",
-                "Asia",
-                "Europe",
-                "Oceania"
-            ]
+            plots.COUNTRY_CONTINENTS
         )
 
     with col2:
-        df = country[country["Continent"]==continent][numerical]
-        fig, ax = plt.subplots()
-
-        if plot == "Box plot":
-            sns.boxplot(x=df, width=0.5)
-
-        elif plot == "Histogram":
-            sns.histplot(x=df)
-
-        elif plot == "Density plot":
-            sns.histplot(x=df, kde=True, stat="density")
-
-        ax.set_xlabel(numerical, fontsize=14)
-        ax.ticklabel_format(style='plain', axis='x')
-
-        if plot=="Histogram": ax.set_ylabel("Count", fontsize=14)
-        if plot=="Density plot":
-            ax.set_ylabel("Density", fontsize=14)
-            ax.ticklabel_format(style='plain', axis='y')
-
-        st.pyplot(fig)
+        figures.show(plots.country_complete, "country_complete", plot, numerical, continent)
 
 with tab2:
-        for i in ["Africa","Americas","Asia","Europe","Oceania"]:
+        for i in plots.COUNTRY_CONTINENTS:
             if i!="Americas":
                 st.subheader("Summary statistics for " + i)
             else: st.subheader("Summary statistics for the Americas")
-            summary = country[country["Continent"]==i].describe()
+            summary = summaries.summary_cube("country_complete").describe_group("Continent", i)
             st.dataframe(summary)
@@ -1,7 +1,10 @@
 import pandas as pd
 import streamlit as st
 from st_aggrid import AgGrid, GridOptionsBuilder, GridOptionsBuilder, ColumnsAutoSizeMode
-from st_aggrid.shared import GridUpdateMode
+from st_aggrid.shared import DataReturnMode, GridUpdateMode
+
+import datasets
+import grid_backend
 
 st.set_page_config(
     layout="centered"
@@ -56,8 +59,62 @@ def aggrid_interactive_table(df: pd.DataFrame):
     return selection
 
 
-country = pd.read_csv(
-    "country_complete.csv"
-)
+# Tables longer than this start in server-side mode.
+SERVER_SIDE_ROWS = 10000
+
+NUMERICAL = ["Years", "Fertility", "Emissions", "Internet"]
+CATEGORICAL = ["Continent", "Internet access", "Emissions range"]
+
+
+def aggrid_server_side_table(name: str):
+    """
+    Shows one block of rows at a time from grid_backend. Grouping, aggregation
+    and sorting run in Python, and only selection changes are sent back.
+    """
+    col1, col2, col3, col4 = st.columns(4)
+    group_by = col1.multiselect("Group by", CATEGORICAL)
+    agg_func = col2.selectbox("Aggregate", list(grid_backend.AGG_FUNCS), disabled=not group_by)
+    value_cols = NUMERICAL if group_by else []
+    columns = group_by + value_cols if group_by else list(datasets.load(name).columns)
+    sort_col = col3.selectbox("Sort by", [None, *columns])
+    sort = col4.selectbox("Order", ["asc", "desc"], disabled=sort_col is None)
+
+    block_key = "country_block"
+    result = grid_backend.get_rows(name, grid_backend.request(
+        start_row=st.session_state.get(block_key, 0) * grid_backend.BLOCK_SIZE,
+        end_row=(st.session_state.get(block_key, 0) + 1) * grid_backend.BLOCK_SIZE,
+        row_group_cols=group_by,
+        value_cols=value_cols,
+        agg_func=agg_func,
+        sort_model=[(sort_col, sort)] if sort_col else [],
+    ))
+    blocks = max(1, -(-result["rowCount"] // grid_backend.BLOCK_SIZE))
+    if st.session_state.get(block_key, 0) >= blocks:
+        st.session_state[block_key] = 0
+        st.rerun()
+
+    options = GridOptionsBuilder.from_dataframe(result["rowData"])
+    options.configure_columns([c for c in NUMERICAL if c in result["rowData"]], type=["numericColumn","numberColumnFilter","customNumericFormat"], precision=1)
+    # Sorting is done by the backend across all rows, not within the block.
+    options.configure_default_column(sortable=False)
+    options.configure_selection("single")
+    selection = AgGrid(
+        result["rowData"],
+        height=400,
+        gridOptions=options.build(),
+        theme="alpine",
+        update_mode=GridUpdateMode.SELECTION_CHANGED,
+        data_return_mode=DataReturnMode.MINIMAL,
+        columns_auto_size_mode=ColumnsAutoSizeMode.FIT_CONTENTS
+    )
+    st.number_input(f"Block of {grid_backend.BLOCK_SIZE} rows (of {blocks})", 0, blocks - 1, key=block_key)
+
+    return selection
+
+
+country = datasets.load_country_complete()
 
-selection = aggrid_interactive_table(df=country)
+if st.toggle("Server-side row model", value=len(country) > SERVER_SIDE_ROWS):
+    selection = aggrid_server_side_table("country_complete")
+else:
+    selection = aggrid_interactive_table(df=country)
@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
 
-country = pd.read_csv("country.csv")
+import datasets
+import tables
+
+country = datasets.load_country()
 
 st.title("Manipulating the country dataset")
 
@@ -35,13 +37,13 @@ group = st.selectbox(
 
 if continent:
     if group!=None:
-        country_sub = country_sub[country_sub["Continent"] == group]
-        st.dataframe(country_sub)
+        country_sub = country_sub.take(datasets.group_positions("country", "Continent", group))
+        tables.paged_dataframe(country_sub, key="country", source=("country", datasets.version("country"), group))
         st.subheader("Mean population of all countries in " + group)
-        st.text(country_sub.mean().round(0))
+        st.text(country_sub.mean(numeric_only=True).round(0))
     elif group==None:
-        st.dataframe(country_sub)
+        tables.paged_dataframe(country_sub, key="country", source=("country", datasets.version("country"), None))
         st.subheader("Mean population of all countries")
-        st.text(country_sub.mean().round(0))
+        st.text(country_sub.mean(numeric_only=True).round(0))
 else:
-    st.dataframe(country_sub)
+    tables.paged_dataframe(country_sub, key="country", source=("country", datasets.version("country"), None))
@@ -0,0 +1,293 @@
+"""
+Shared loaders for the datasets used by the apps.
+
+Every dataset is parsed once and cached across sessions, together with the
+column renames and recodings the apps expect. A cached dataset is invalidated
+as soon as the modification time or size of its source file changes.
+
+CSV datasets are read through a typed Arrow sidecar file in .sidecars/, which
+is memory-mapped instead of tokenizing the CSV text. A sidecar records the
+version of the CSV it was built from and is rebuilt when the CSV changes.
+Run `python datasets.py` to build all sidecars ahead of time.
+
+Low-cardinality string columns are converted to categoricals when loaded, and
+group_positions gives the row positions of one value of such a column, so a
+group can be sliced with take() instead of a full-column string comparison.
+
+The seaborn example datasets (tips, penguins) are vendored in vendored/ as
+Arrow files, so the apps never reach the network. `python datasets.py vendor`
+refreshes them from seaborn on a machine with internet access.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import streamlit as st
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SIDECAR_DIR = os.path.join(HERE, ".sidecars")
+VENDOR_DIR = os.path.join(HERE, "vendored")
+
+TIPS_COLUMNS = ["Total bill", "Tip", "Sex", "Smoker", "Day", "Time", "Party size"]
+
+PENGUINS_COLUMNS = ["species", "island", "bill_length_mm", "bill_depth_mm", "flipper_length_mm", "body_mass_g", "sex"]
+
+# String columns with at most this fraction of distinct values become categoricals.
+CATEGORY_MAX_RATIO = 0.5
+
+CRAB_COLUMNS = ["Site", "Latitude", "Sample size", "Mean length", "Min length", "Max length", "Stdev length", "Median length", "Date"]
+
+
+def _prepare_crabs(crabs):
+    crabs.columns = CRAB_COLUMNS
+    return crabs[["Site", "Date", "Sample size", "Latitude", "Mean length", "Min length", "Max length", "Median length"]]
+
+
+def _prepare_wbcd(wbcd):
+    wbcd["Diagnosis"] = wbcd["Diagnosis"].map({"B": 0, "M": 1}).astype(int)
+    return wbcd
+
+
+# Dataset name -> (source file, function applied once after parsing)
+CSV_DATASETS = {
+    "country": ("country.csv", None),
+    "country_complete": ("country_complete.csv", None),
+    "crabs": ("crab-groups.csv", _prepare_crabs),
+    "gapminder": ("gapminder.csv", None),
+    "mpg": ("mpg.csv", None),
+    "oldfaithful": ("oldfaithful.csv", None),
+    "wbcd": ("WisconsinBreastCancerDatabase.csv", _prepare_wbcd),
+}
+
+# Vendored seaborn dataset name -> column names used by the apps
+SEABORN_DATASETS = {
+    "penguins": PENGUINS_COLUMNS,
+    "tips": TIPS_COLUMNS,
+}
+
+
+def path(filename):
+    return os.path.join(HERE, filename)
+
+
+def vendored_path(name):
+    return os.path.join(VENDOR_DIR, name + ".arrow")
+
+
+def _source_path(name):
+    if name in SEABORN_DATASETS:
+        return vendored_path(name)
+    filename, _ = CSV_DATASETS[name]
+    return path(filename)
+
+
+def version(name):
+    """
+    Returns a string identifying the current version of a dataset's source file.
+    """
+    stat = os.stat(_source_path(name))
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def fingerprint(*arrays):
+    """
+    Returns a hex digest of the dtype, shape and contents of the given arrays.
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype}{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def sidecar_path(name):
+    return os.path.join(SIDECAR_DIR, name + ".arrow")
+
+
+def build_sidecar(name):
+    """
+    Parses a dataset's CSV and writes it to an uncompressed Arrow IPC file that
+    can be memory-mapped. Returns the parsed table.
+    """
+    filename, _ = CSV_DATASETS[name]
+    source_version = version(name)
+    table = pa.Table.from_pandas(pd.read_csv(path(filename)), preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), b"source_version": source_version.encode()}
+    )
+
+    try:
+        os.makedirs(SIDECAR_DIR, exist_ok=True)
+        # Write to a temporary file first so that concurrent readers never see
+        # a partially written sidecar.
+        fd, tmp = tempfile.mkstemp(dir=SIDECAR_DIR, suffix=".tmp")
+        os.close(fd)
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, sidecar_path(name))
+    except OSError:
+        # A read-only checkout still works, it just parses the CSV every time.
+        pass
+
+    return table
+
+
+def _read_table(name):
+    try:
+        table = feather.read_table(sidecar_path(name), memory_map=True)
+    except (OSError, pa.ArrowInvalid):
+        return build_sidecar(name)
+
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"source_version") != version(name).encode():
+        return build_sidecar(name)
+    return table
+
+
+@st.cache_resource(show_spinner=False)
+def _load_csv(name, source_version):
+    # source_version is only part of the cache key, so that editing the file
+    # invalidates the cached frame.
+    _, prepare = CSV_DATASETS[name]
+    # split_blocks lets numeric columns without nulls stay backed by the
+    # memory-mapped sidecar instead of being copied into one pandas block.
+    df = _read_table(name).to_pandas(split_blocks=True)
+    if prepare is not None:
+        df = prepare(df)
+    return categorize(df)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_vendored(name, source_version):
+    df = feather.read_table(vendored_path(name), memory_map=True).to_pandas(split_blocks=True)
+    df.columns = SEABORN_DATASETS[name]
+    return categorize(df)
+
+
+def categorize(df):
+    """
+    Converts the low-cardinality string columns of df to categoricals.
+
+    Categories are sorted, so groupby and value_counts tables list groups in
+    the same order as for the original strings. Seaborn orders string columns
+    by first appearance instead; plots.py restores that order where needed.
+    """
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype) or not pd.api.types.is_string_dtype(values):
+            continue
+        distinct = values.dropna().unique()
+        if len(distinct) <= CATEGORY_MAX_RATIO * len(values):
+            df[column] = pd.Categorical(values, categories=sorted(distinct))
+    return df
+
+
+class GroupIndex:
+    """
+    Row positions of every value of a categorical column.
+    """
+
+    def __init__(self, values):
+        codes = values.cat.codes.to_numpy()
+        order = np.argsort(codes, kind="stable")
+        # Missing values have code -1 and sort before every category.
+        bounds = np.searchsorted(codes[order], np.arange(len(values.cat.categories) + 1))
+        self._positions = {
+            category: order[bounds[i]:bounds[i + 1]]
+            for i, category in enumerate(values.cat.categories)
+        }
+
+    def positions(self, value):
+        return self._positions.get(value, np.array([], dtype=np.intp))
+
+
+@st.cache_resource(show_spinner=False)
+def _group_index(name, column, source_version):
+    return GroupIndex(load(name)[column])
+
+
+def group_positions(name, column, value):
+    """
+    Returns the positions of the rows of dataset name where the categorical
+    column equals value, in row order. Use with DataFrame.take().
+    """
+    return _group_index(name, column, version(name)).positions(value)
+
+
+def load(name):
+    """
+    Returns the cached, prepared DataFrame for one of CSV_DATASETS or
+    SEABORN_DATASETS.
+
+    The frame is shared by every session in the process and must be treated as
+    read-only.
+    """
+    if name in SEABORN_DATASETS:
+        return _load_vendored(name, version(name))
+    return _load_csv(name, version(name))
+
+
+def vendor_seaborn_dataset(name):
+    """
+    Downloads a seaborn example dataset and stores it in vendored/. This needs
+    network access and is only meant to be run by hand.
+    """
+    import seaborn as sns
+
+    table = pa.Table.from_pandas(sns.load_dataset(name, cache=False), preserve_index=False)
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    feather.write_feather(table, vendored_path(name), compression="uncompressed")
+
+
+def load_country():
+    return load("country")
+
+
+def load_country_complete():
+    return load("country_complete")
+
+
+def load_crabs():
+    return load("crabs")
+
+
+def load_gapminder():
+    return load("gapminder")
+
+
+def load_mpg():
+    return load("mpg")
+
+
+def load_oldfaithful():
+    return load("oldfaithful")
+
+
+def load_wbcd():
+    return load("wbcd")
+
+
+def load_tips():
+    return load("tips")
+
+
+def load_penguins():
+    return load("penguins")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if sys.argv[1:] == ["vendor"]:
+        for name in SEABORN_DATASETS:
+            vendor_seaborn_dataset(name)
+            print("Vendored " + os.path.relpath(vendored_path(name), HERE))
+    else:
+        for name in CSV_DATASETS:
+            build_sidecar(name)
+            print("Built " + os.path.relpath(sidecar_path(name), HERE))
@@ -0,0 +1,78 @@
+"""
+File exports for download buttons.
+
+A frame is written to a temporary file in chunks of CHUNK_ROWS rows, so no
+full CSV string or workbook is held in memory while exporting. Nothing is
+exported until the user clicks the download button, so reruns while the frame
+is being edited cost nothing. The file is then read back and removed.
+"""
+
+import os
+import tempfile
+from functools import partial
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+CHUNK_ROWS = 50000
+
+
+def _write_csv(df, path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for start in range(0, max(len(df), 1), CHUNK_ROWS):
+            df.iloc[start:start + CHUNK_ROWS].to_csv(f, index=False, header=start == 0)
+
+
+def _write_parquet(df, path):
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, len(df), CHUNK_ROWS):
+            chunk = df.iloc[start:start + CHUNK_ROWS]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _write_xlsx(df, path):
+    from openpyxl import Workbook
+
+    # A write-only workbook streams rows to disk instead of keeping every cell.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append([str(column) for column in df.columns])
+    for start in range(0, len(df), CHUNK_ROWS):
+        chunk = df.iloc[start:start + CHUNK_ROWS].astype(object)
+        for row in chunk.where(chunk.notna(), None).itertuples(index=False):
+            sheet.append(row)
+    workbook.save(path)
+
+
+# Format -> (file extension, MIME type, writer)
+FORMATS = {
+    "CSV": (".csv", "text/csv", _write_csv),
+    "Parquet": (".parquet", "application/vnd.apache.parquet", _write_parquet),
+    "Excel": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", _write_xlsx),
+}
+
+
+def export(df, format="CSV"):
+    """
+    Returns the contents of df written in one of FORMATS.
+    """
+    suffix, _, write = FORMATS[format]
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        write(df, path)
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(path)
+
+
+def download_button(label, df, file_name, format="CSV", **kwargs):
+    """
+    Shows a download button for df in one of FORMATS. file_name is given
+    without an extension. df is only exported when the button is clicked.
+    """
+    suffix, mime, _ = FORMATS[format]
+    return st.download_button(label, partial(export, df, format), file_name + suffix, mime, **kwargs)
@@ -0,0 +1,144 @@
+"""
+Cache of rendered figures shared by the plotting apps.
+
+Figures are keyed by (draw function, dataset version, widget values) and stored
+as encoded PNG bytes, so a combination of widget values that anybody has
+already looked at is served without rebuilding or rasterizing the figure. The
+cache is shared across sessions and holds at most FIGURE_CACHE_MAX_BYTES bytes
+(256 MB by default), evicting the least recently used images first.
+
+Setting FIGURE_WARMUP=1 enables the warm-up mode: the first time an app shows
+a figure, every other combination in plots.WIDGET_SPACES for that app is
+rendered in a background process pool (FIGURE_WARMUP_WORKERS processes,
+defaulting to the CPU count) and added to the cache.
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import streamlit as st
+
+import datasets
+import lazy
+import plots
+
+# Only needed when a figure is not cached yet.
+matplotlib = lazy.module("matplotlib")
+plt = lazy.module("matplotlib.pyplot")
+
+MAX_BYTES = int(os.environ.get("FIGURE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+WARMUP = os.environ.get("FIGURE_WARMUP", "0") not in ("", "0")
+WARMUP_WORKERS = int(os.environ.get("FIGURE_WARMUP_WORKERS", os.cpu_count() or 1))
+
+# The same options st.pyplot uses, so cached images look identical.
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200, "format": "png"}
+
+
+class FigureCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._images
+
+    def get(self, key):
+        with self._lock:
+            png = self._images.get(key)
+            if png is not None:
+                self._images.move_to_end(key)
+            return png
+
+    def put(self, key, png):
+        if len(png) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._images:
+                self.size -= len(self._images.pop(key))
+            self._images[key] = png
+            self.size += len(png)
+            while self.size > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self.size -= len(evicted)
+
+
+@st.cache_resource(show_spinner=False)
+def figure_cache():
+    return FigureCache(MAX_BYTES)
+
+
+def render_png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **SAVEFIG_OPTIONS)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def cache_key(draw, dataset, *args):
+    return (draw.__module__, draw.__name__, dataset, datasets.version(dataset), args)
+
+
+def render(draw, dataset, *args):
+    """
+    Returns the PNG bytes of draw(datasets.load(dataset), *args), rendering it
+    only if it is not cached yet. args must be hashable widget values.
+    """
+    cache = figure_cache()
+    key = cache_key(draw, dataset, *args)
+    png = cache.get(key)
+    if png is None:
+        png = render_png(draw(datasets.load(dataset), *args))
+        cache.put(key, png)
+    return png
+
+
+def _init_worker():
+    matplotlib.use("Agg")
+
+
+def _render_in_worker(draw_name, dataset, args):
+    draw = getattr(plots, draw_name)
+    return render_png(draw(datasets.load(dataset), *args))
+
+
+def _store_result(cache, key):
+    def store(future):
+        if future.exception() is None:
+            cache.put(key, future.result())
+    return store
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_up(draw_name, dataset, dataset_version):
+    # Runs once per app and dataset version. The pool is returned so that it
+    # stays referenced while the background renders finish.
+    cache = figure_cache()
+    draw = getattr(plots, draw_name)
+    pool = ProcessPoolExecutor(
+        max_workers=WARMUP_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+    for args in plots.WIDGET_SPACES.get(draw_name, []):
+        key = cache_key(draw, dataset, *args)
+        if key not in cache:
+            future = pool.submit(_render_in_worker, draw_name, dataset, args)
+            future.add_done_callback(_store_result(cache, key))
+    pool.shutdown(wait=False)
+    return pool
+
+
+def show(draw, dataset, *args):
+    """
+    Displays the cached figure for draw, dataset and widget values args.
+    """
+    if WARMUP:
+        _warm_up(draw.__name__, dataset, datasets.version(dataset))
+    st.image(render(draw, dataset, *args), width="stretch")
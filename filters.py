@@ -0,0 +1,138 @@
+"""
+Column profiles and the filter engine behind the dataframe filter UI in
+penguins_5.py.
+
+Profiling a table (trying to parse object columns as datetimes, counting
+distinct values, finding numeric ranges) is done once per dataset version and
+cached, and the filter widgets are built from the stored profiles.
+
+The active filters are collected as Predicates, each evaluated to a boolean
+mask over the whole table. The masks are ANDed and the result is materialized
+once, and a predicate's mask is reused across reruns until that predicate
+changes.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pandas.api.types import (
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+import datasets
+
+# Columns with fewer distinct values than this are filtered by value.
+MAX_CATEGORIES = 10
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    name: str
+    # "categorical", "numeric", "datetime" or "text"
+    kind: str
+    cardinality: int
+    minimum: Any = None
+    maximum: Any = None
+    values: tuple = ()
+    parsed_datetime: bool = False
+
+
+def _parse_datetimes(df):
+    # Try to convert datetimes into a standard format (datetime, no timezone)
+    parsed = []
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            continue
+        if is_object_dtype(values) or is_string_dtype(values):
+            try:
+                df[col] = pd.to_datetime(values)
+                parsed.append(col)
+            except Exception:
+                pass
+
+        if is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].dt.tz_localize(None)
+    return parsed
+
+
+def profile_column(values, parsed_datetime=False):
+    cardinality = values.nunique()
+    if isinstance(values.dtype, pd.CategoricalDtype) or cardinality < MAX_CATEGORIES:
+        return ColumnProfile(values.name, "categorical", cardinality, values=tuple(values.unique()))
+    if is_numeric_dtype(values):
+        return ColumnProfile(values.name, "numeric", cardinality, float(values.min()), float(values.max()))
+    if is_datetime64_any_dtype(values):
+        return ColumnProfile(values.name, "datetime", cardinality, values.min(), values.max(), parsed_datetime=parsed_datetime)
+    return ColumnProfile(values.name, "text", cardinality)
+
+
+@dataclass(frozen=True)
+class ProfiledFrame:
+    df: pd.DataFrame
+    profiles: dict
+
+
+@st.cache_resource(show_spinner=False)
+def _profiled_dataset(name, dropna, source_version):
+    df = datasets.load(name)
+    df = df.dropna() if dropna else df.copy()
+    parsed = _parse_datetimes(df)
+    profiles = {col: profile_column(df[col], col in parsed) for col in df.columns}
+    return ProfiledFrame(df, profiles)
+
+
+def profiled_dataset(name, dropna=False):
+    """
+    Returns a ProfiledFrame of one of the datasets in datasets.py, with
+    datetime-like columns parsed and a ColumnProfile for every column. The
+    frame is shared across sessions and must not be modified.
+    """
+    return _profiled_dataset(name, dropna, datasets.version(name))
+
+
+@dataclass(frozen=True)
+class Predicate:
+    column: str
+    # "isin", "between" or "contains"
+    kind: str
+    args: tuple
+
+    def mask(self, df):
+        values = df[self.column]
+        if self.kind == "isin":
+            mask = values.isin(self.args)
+        elif self.kind == "between":
+            mask = values.between(*self.args)
+        elif self.kind == "contains":
+            mask = values.str.contains(*self.args, na=False)
+        else:
+            raise ValueError(f"Unknown predicate kind: {self.kind}")
+        return mask.to_numpy(dtype=bool)
+
+
+def apply_filters(profiled, predicates, key="filter_masks"):
+    """
+    Returns the rows of profiled.df that satisfy every predicate.
+
+    Masks are kept in st.session_state[key] for the current frame, so when one
+    widget changes only that predicate's mask is recomputed.
+    """
+    df = profiled.df
+    if not predicates:
+        return df
+
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] is not profiled:
+        cached = (profiled, {})
+    masks = {p: cached[1][p] if p in cached[1] else p.mask(df) for p in predicates}
+    # Only keep the masks of the active predicates.
+    st.session_state[key] = (profiled, masks)
+
+    return df[np.logical_and.reduce(list(masks.values()))]
@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import figures
+import plots
 
 hide = """
         <style>
@@ -17,8 +17,6 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-gapminder = pd.read_csv("gapminder.csv")
-
 # st.header("Visualizing the tips dataset")
 
 col1, col2 = st.columns([1,3])
@@ -26,53 +24,19 @@ col1, col2 = st.columns([1,3])
 with col1:
     plot = st.selectbox(
         "Plot",
-        [
-            "Box plot",
-            "Density plot",
-            "Histogram"
-        ]
+        plots.DISTRIBUTION_PLOTS
     )
 
     numerical = st.selectbox(
         "Numerical feature",
-        [
-            "GDP per capita",
-            "Life expectancy",
-            "Population"
-        ]
+        plots.GAPMINDER_NUMERICAL
     )
 
     continent = st.selectbox(
         "Continent",
-        [
-            "Africa",
-            "Americas",
-            "Asia",
-            "Europe"
-        ]
+        plots.GAPMINDER_CONTINENTS
     )
 
 
 with col2:
-    df = gapminder[gapminder["Continent"]==continent][numerical]
-    fig, ax = plt.subplots()
-
-    if plot == "Box plot":
-        sns.boxplot(x=df, width=0.5)
-
-    elif plot == "Histogram":
-        sns.histplot(x=df)
-
-    elif plot == "Density plot":
-        sns.histplot(x=df, kde=True)
-
-    ax.set_xlabel(numerical, fontsize=14)
-    ax.ticklabel_format(style='plain', axis='x')
-
-    if plot=="Histogram": ax.set_ylabel("Count", fontsize=14)
-    if numerical=="Population": ax.tick_params(axis='x', labelrotation = 20)
-    if plot=="Density plot":
-        ax.set_ylabel("Count", fontsize=14)
-        ax.ticklabel_format(style='plain', axis='y')
-
-    st.pyplot(fig)
+    figures.show(plots.gapminder, "gapminder", plot, numerical, continent)
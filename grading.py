@@ -0,0 +1,183 @@
+"""
+Grading of journal entries against an answer key.
+
+An AnswerKey is compiled into arrays of expected accounts, debits, credits and
+dates, and a journal is graded by comparing its first lines against them in
+one vectorized pass. A blank expected amount means the cell must be blank, and
+a missing expected date means dates are not graded. Dates are compared by
+month and day only, since the exercises do not fix the year.
+
+A folder of submitted journals (.xlsx or .csv, one per student) is graded in
+a process pool:
+
+    python grading.py accrued_salaries submissions/ results.csv
+"""
+
+import argparse
+import datetime
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+FIELDS = ["account", "debit", "credit", "date"]
+
+# Submissions handed to each worker at a time.
+CHUNK_SIZE = 16
+
+
+@dataclass(frozen=True)
+class Line:
+    account: str
+    debit: Optional[float] = None
+    credit: Optional[float] = None
+    date: Optional[datetime.date] = None
+
+
+class Grade(NamedTuple):
+    # Boolean array with one row per key line and one column per FIELDS entry.
+    correct: np.ndarray
+    extra_lines: int
+
+    @property
+    def score(self):
+        return self.correct.mean() if self.correct.size else 1.0
+
+    @property
+    def passed(self):
+        return bool(self.correct.all()) and self.extra_lines == 0
+
+    def mistakes(self):
+        """
+        Returns the (line, field) pairs that do not match the key, in order.
+        """
+        return [(int(i), FIELDS[j]) for i, j in zip(*np.nonzero(~self.correct))]
+
+
+def _amounts(values):
+    if not is_numeric_dtype(values):
+        values = values.astype(str).str.replace(r"[$,\s]", "", regex=True)
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+
+
+def _month_days(values):
+    dates = pd.to_datetime(values, errors="coerce")
+    return (dates.dt.month * 100 + dates.dt.day).fillna(-1).to_numpy(dtype=int)
+
+
+def _column(journal, name, position):
+    # Submissions name their columns differently ("Account", "Account Name"),
+    # so match by name first and fall back to the column's usual position.
+    for column in journal.columns:
+        if name in str(column).lower():
+            return journal[column]
+    if position is not None and position < journal.shape[1]:
+        return journal.iloc[:, position]
+    return pd.Series([None] * len(journal), index=journal.index, dtype=object)
+
+
+def normalize(journal):
+    """
+    Returns journal as a frame with one column per FIELDS entry: stripped
+    account names, numeric amounts (NaN when blank) and dates as month * 100 +
+    day (-1 when blank). Blank lines are dropped.
+    """
+    accounts = _column(journal, "account", 0).astype(object)
+    accounts = accounts.where(accounts.notna(), "").astype(str).str.strip().to_numpy()
+    debits = _amounts(_column(journal, "debit", 1))
+    credits = _amounts(_column(journal, "credit", 2))
+    dates = _month_days(_column(journal, "date", None))
+    blank = (accounts == "") & np.isnan(debits) & np.isnan(credits) & (dates == -1)
+    return pd.DataFrame({"account": accounts, "debit": debits, "credit": credits, "date": dates})[~blank]
+
+
+class AnswerKey:
+    def __init__(self, lines):
+        self.lines = list(lines)
+        self.accounts = np.array([line.account for line in self.lines], dtype=object)
+        self.debits = np.array([np.nan if line.debit is None else line.debit for line in self.lines])
+        self.credits = np.array([np.nan if line.credit is None else line.credit for line in self.lines])
+        self.dates = np.array([-1 if line.date is None else line.date.month * 100 + line.date.day for line in self.lines])
+        self.check_dates = any(line.date is not None for line in self.lines)
+
+    def grade(self, journal):
+        """
+        Returns the Grade of a journal DataFrame with account, debit, credit
+        and optionally date columns.
+        """
+        lines = normalize(journal).reset_index(drop=True)
+        n = len(self.lines)
+        # Missing lines are compared as blank lines.
+        given = lines.reindex(range(n))
+        accounts = given["account"].fillna("").to_numpy(dtype=object)
+        dates = given["date"].fillna(-1).to_numpy()
+
+        correct = np.column_stack([
+            accounts == self.accounts,
+            np.isclose(given["debit"], self.debits, equal_nan=True),
+            np.isclose(given["credit"], self.credits, equal_nan=True),
+            dates == self.dates if self.check_dates else np.ones(n, dtype=bool),
+        ])
+        return Grade(correct, max(len(lines) - n, 0))
+
+
+KEYS = {
+    # adjusting_entries_excel.py
+    "accrued_salaries": AnswerKey([
+        Line("Salaries and Wages Expense", debit=800),
+        Line("Salaries and Wages Payable", credit=800),
+    ]),
+    # adjusting_entries.py
+    "accrued_electricity": AnswerKey([
+        Line("Electricity bill", debit=12000, date=datetime.date(2025, 9, 30)),
+        Line("Accrued expenses", credit=12000, date=datetime.date(2025, 9, 30)),
+    ]),
+}
+
+
+def read_journal(path):
+    if path.lower().endswith(".csv"):
+        return pd.read_csv(path)
+    return pd.read_excel(path, engine="openpyxl")
+
+
+def _grade_file(key, path):
+    student = os.path.splitext(os.path.basename(path))[0]
+    try:
+        grade = key.grade(read_journal(path))
+    except Exception as e:
+        return {"student": student, "score": 0.0, "passed": False, "mistakes": f"Could not read submission: {e}"}
+    mistakes = "; ".join(f"line {i + 1} {field}" for i, field in grade.mistakes())
+    if grade.extra_lines:
+        mistakes = "; ".join(filter(None, [mistakes, f"{grade.extra_lines} extra lines"]))
+    return {"student": student, "score": grade.score, "passed": grade.passed, "mistakes": mistakes}
+
+
+def grade_directory(key, folder, workers=None):
+    """
+    Grades every .xlsx and .csv journal in folder against key and returns one
+    row per submission, named after the file.
+    """
+    paths = sorted(glob.glob(os.path.join(folder, "*.xlsx")) + glob.glob(os.path.join(folder, "*.csv")))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = list(pool.map(partial(_grade_file, key), paths, chunksize=CHUNK_SIZE))
+    return pd.DataFrame(rows, columns=["student", "score", "passed", "mistakes"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grade a folder of submitted journals.")
+    parser.add_argument("key", choices=list(KEYS))
+    parser.add_argument("folder")
+    parser.add_argument("output", help="CSV file for the per-student results")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    results = grade_directory(KEYS[args.key], args.folder, args.workers)
+    results.to_csv(args.output, index=False)
+    print(f"Graded {len(results)} submissions, {int(results['passed'].sum())} passed")
@@ -0,0 +1,89 @@
+"""
+Server-side row model for AgGrid tables.
+
+Requests follow the shape of AG Grid's server-side row model requests
+(IServerSideGetRowsRequest): a block of rows from startRow to endRow, optional
+row group columns with aggregated value columns, and a sort model. Rows are
+grouped, aggregated and sorted here on the cached dataset, and only the
+requested block is sent to the grid.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import datasets
+
+BLOCK_SIZE = 100
+
+# AG Grid aggregation function name -> pandas aggregation
+AGG_FUNCS = {
+    "avg": "mean",
+    "sum": "sum",
+    "min": "min",
+    "max": "max",
+    "count": "count",
+}
+
+
+def request(start_row=0, end_row=BLOCK_SIZE, row_group_cols=(), value_cols=(), agg_func="avg", sort_model=()):
+    """
+    Builds a request for get_rows. sort_model is a sequence of (column, "asc"
+    or "desc") pairs.
+    """
+    return {
+        "startRow": start_row,
+        "endRow": end_row,
+        "rowGroupCols": [{"field": field} for field in row_group_cols],
+        "valueCols": [{"field": field, "aggFunc": agg_func} for field in value_cols],
+        "sortModel": [{"colId": col, "sort": sort} for col, sort in sort_model],
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _rows(name, source_version, row_group_cols, value_cols):
+    df = datasets.load(name)
+    if not row_group_cols:
+        return df
+    aggregations = {field: AGG_FUNCS[agg_func] for field, agg_func in value_cols}
+    grouped = df.groupby(list(row_group_cols), observed=True, sort=False)
+    if aggregations:
+        grouped = grouped.agg(aggregations)
+    else:
+        grouped = grouped.size().to_frame("Count")
+    return grouped.reset_index()
+
+
+@st.cache_resource(show_spinner=False)
+def _sorted_positions(name, source_version, row_group_cols, value_cols, sort_model):
+    rows = _rows(name, source_version, row_group_cols, value_cols)
+    columns = [col for col, _ in sort_model]
+    ascending = [sort == "asc" for _, sort in sort_model]
+    # Sort a frame of positions so that only the positions are materialized.
+    keys = rows[columns].assign(_position=np.arange(len(rows)))
+    # Categoricals sort in category order; sort them by value like the grid does.
+    for col in dict.fromkeys(columns):
+        if isinstance(keys[col].dtype, pd.CategoricalDtype):
+            keys[col] = keys[col].cat.reorder_categories(keys[col].cat.categories.sort_values())
+    return keys.sort_values(columns, ascending=ascending, kind="stable")["_position"].to_numpy()
+
+
+def get_rows(name, request):
+    """
+    Answers a server-side row model request against one of the datasets in
+    datasets.py. Returns {"rowData": DataFrame block, "rowCount": total rows}.
+    """
+    source_version = datasets.version(name)
+    row_group_cols = tuple(col["field"] for col in request["rowGroupCols"])
+    value_cols = tuple((col["field"], col["aggFunc"]) for col in request["valueCols"])
+    sort_model = tuple((col["colId"], col["sort"]) for col in request["sortModel"])
+
+    rows = _rows(name, source_version, row_group_cols, value_cols)
+    block = slice(request["startRow"], request["endRow"])
+    if sort_model:
+        positions = _sorted_positions(name, source_version, row_group_cols, value_cols, sort_model)
+        row_data = rows.take(positions[block])
+    else:
+        row_data = rows.iloc[block]
+
+    return {"rowData": pd.DataFrame(row_data).reset_index(drop=True), "rowCount": len(rows)}
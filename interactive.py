@@ -0,0 +1,183 @@
+"""
+Plotly versions of the figures whose slider only moves one overlay.
+
+Each figure is sent to the browser once with every slider position built in as
+a Plotly slider step. A step restyles just the overlay traces (cutoff lines,
+secant line, prediction marker) and the text describing them, so moving the
+slider is handled by the browser without rerunning the app.
+"""
+
+import numpy as np
+
+import lazy
+import models
+
+go = lazy.module("plotly.graph_objects")
+
+SLIDER_STYLE = {"currentvalue": {"visible": False}, "pad": {"t": 40}}
+
+
+def _slider(steps, active):
+    return [dict(SLIDER_STYLE, active=active, steps=steps)]
+
+
+def _nearest(values, value):
+    return int(np.abs(np.asarray(values) - value).argmin())
+
+
+def logistic_cutoffs(X, y, model, table, cutoffs, cutoff, x_label, y_label):
+    """
+    Scatter plot of a binary target against one feature with the logistic
+    curve, and the probability cutoff and decision boundary for each of
+    cutoffs. table is the ThresholdTable of the model, used for the metrics.
+    """
+    X = np.ravel(X)
+    x_min, x_max = float(X.min()), float(X.max())
+    curve_x, curve_y = models.logistic_curve(model, x_min, x_max)
+
+    fig = go.Figure([
+        go.Scatter(x=X, y=np.ravel(y), mode="markers", name="Data"),
+        go.Scatter(x=curve_x, y=curve_y, mode="lines", line={"color": "red"}, name="Probability"),
+        go.Scatter(mode="lines", line={"color": "gray", "width": 3}, name="Cutoff"),
+        go.Scatter(mode="lines", line={"color": "gray", "width": 3}, name="Boundary"),
+    ])
+
+    steps = []
+    for c in cutoffs:
+        boundary = models.logistic_boundary(model, c)
+        counts = table.counts(c)
+        text = (f"Cutoff {c:.2f}: accuracy {counts.accuracy:.2f}, precision {counts.precision:.2f}, "
+                f"recall {counts.recall:.2f}<br>TP {counts.tp}, FP {counts.fp}, FN {counts.fn}, TN {counts.tn}; "
+                f"positive when {x_label.lower()} ≥ {boundary:.2f}")
+        steps.append({
+            "method": "update",
+            "label": f"{c:.2f}",
+            "args": [
+                {"x": [[x_min, x_max], [boundary, boundary]], "y": [[c, c], [0, 1]]},
+                {"title.text": text},
+                [2, 3],
+            ],
+        })
+
+    active = _nearest(cutoffs, cutoff)
+    for trace, x, y in zip([2, 3], steps[active]["args"][0]["x"], steps[active]["args"][0]["y"]):
+        fig.data[trace].update(x=x, y=y)
+    fig.update_layout(
+        title={"text": steps[active]["args"][1]["title.text"], "font": {"size": 14}},
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        showlegend=False,
+        sliders=_slider(steps, active),
+    )
+    fig.add_annotation(x=x_min, y=0.9, text="FN", showarrow=False, xanchor="left")
+    fig.add_annotation(x=x_min, y=0.1, text="TN", showarrow=False, xanchor="left")
+    fig.add_annotation(x=x_max, y=0.9, text="TP", showarrow=False, xanchor="right")
+    fig.add_annotation(x=x_max, y=0.1, text="FP", showarrow=False, xanchor="right")
+    return fig
+
+
+def _finite(values):
+    values = np.asarray(values, dtype=float)
+    return np.where(np.isfinite(values), values, np.nan)
+
+
+def _value(f, x):
+    """
+    Returns f(x) as a float, or nan if f is not finite or cannot be evaluated
+    at x.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            return float(_finite(f(np.float64(x))))
+    except (ArithmeticError, TypeError, ValueError):
+        return np.nan
+
+
+def secant_lines(f, df, a, hs, h, show_tangent):
+    """
+    Plot of f around a with the secant line through a and a + h for each of
+    hs, and optionally the tangent line at a.
+    """
+    x_vals = np.linspace(a - 5, a + 5, 1000)
+    with np.errstate(all="ignore"):
+        y_vals = _finite(f(x_vals))
+    # A nan y1 or slope leaves the secant and tangent out.
+    y1 = _value(f, a)
+    tangent = y1 + _value(df, a) * (x_vals - a)
+
+    fig = go.Figure([
+        go.Scatter(x=x_vals, y=y_vals, mode="lines", line={"width": 2}, name="f(x)"),
+        go.Scatter(x=x_vals, y=tangent, mode="lines", line={"color": "green", "width": 2},
+            name="Tangent", visible=show_tangent),
+        go.Scatter(mode="lines", line={"color": "red", "width": 2, "dash": "dash"}, name="Secant"),
+        go.Scatter(mode="markers", marker={"color": "red", "size": 9}, name="Points"),
+    ])
+
+    steps = []
+    for step in hs:
+        y2 = _value(f, a + step)
+        if step == 0 or np.isnan(y1) or np.isnan(y2):
+            update = {"x": [[], [a]], "y": [[], [y1]]}
+            text = f"h = {step:.2f}"
+        else:
+            slope = (y2 - y1) / step
+            update = {
+                "x": [[x_vals[0], x_vals[-1]], [a, a + step]],
+                "y": [[y1 + slope * (x_vals[0] - a), y1 + slope * (x_vals[-1] - a)], [y1, y2]],
+            }
+            text = f"h = {step:.2f}, secant slope {slope:.4f}"
+        steps.append({"method": "update", "label": f"{step:.2f}", "args": [update, {"title.text": text}, [2, 3]]})
+
+    active = _nearest(hs, h)
+    for trace, x, y in zip([2, 3], steps[active]["args"][0]["x"], steps[active]["args"][0]["y"]):
+        fig.data[trace].update(x=x, y=y)
+
+    # Fix the axes to the curve so they do not jump between steps.
+    y_min, y_max = np.nanmin(y_vals), np.nanmax(y_vals)
+    y_pad = 0.05 * (y_max - y_min) if y_max > y_min else 1
+    fig.update_layout(
+        title=steps[active]["args"][1]["title.text"],
+        xaxis={"range": [x_vals[0], x_vals[-1]], "zeroline": True},
+        yaxis={"range": [y_min - y_pad, y_max + y_pad], "zeroline": True},
+        showlegend=False,
+        sliders=_slider(steps, active),
+    )
+    return fig
+
+
+def predictions(x, y, m, b, predictors, predictor, x_label, y_label):
+    """
+    Scatter plot with the regression line y = m x + b and a marker at the
+    prediction for each of predictors.
+    """
+    x = np.ravel(x)
+    line_x = np.array([min(x.min(), predictors[0]), max(x.max(), predictors[-1])])
+    fig = go.Figure([
+        go.Scatter(x=x, y=np.ravel(y), mode="markers", name="Data"),
+        go.Scatter(x=line_x, y=m * line_x + b, mode="lines", line={"color": "red"}, name="Regression line"),
+        go.Scatter(mode="markers", marker={"color": "darkorange", "size": 12, "symbol": "diamond"}, name="Prediction"),
+    ])
+
+    steps = []
+    for p in predictors:
+        prediction = m * p + b
+        steps.append({
+            "method": "update",
+            "label": f"{p:.1f}",
+            "args": [
+                {"x": [[p]], "y": [[prediction]]},
+                {"title.text": f"Predicted {y_label.lower()} at {x_label.lower()} {p:.1f}: {prediction:.2f}"},
+                [2],
+            ],
+        })
+
+    active = _nearest(predictors, predictor)
+    fig.data[2].update(x=steps[active]["args"][0]["x"][0], y=steps[active]["args"][0]["y"][0])
+    fig.update_layout(
+        title=steps[active]["args"][1]["title.text"],
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        showlegend=False,
+        sliders=_slider(steps, active),
+    )
+    return fig
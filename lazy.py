@@ -0,0 +1,31 @@
+"""
+Deferred imports for heavy libraries.
+
+    sns = lazy.module("seaborn")
+
+binds sns to a placeholder that imports seaborn the first time one of its
+attributes is used, so apps only pay for seaborn, matplotlib, sklearn or sympy
+on the code paths that need them. Run profile_imports.py to see what each app
+still imports eagerly.
+"""
+
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    def __getattr__(self, name):
+        # Only called for attributes not copied over yet, i.e. before the
+        # first import. importlib serializes concurrent imports of a module.
+        loaded = importlib.import_module(self.__name__)
+        self.__dict__.update(vars(loaded))
+        return getattr(loaded, name)
+
+
+def module(name):
+    """
+    Returns a stand-in for the module called name that imports it on first
+    attribute access. Use as `plt = lazy.module("matplotlib.pyplot")`, not
+    with `from ... import`.
+    """
+    return LazyModule(name)
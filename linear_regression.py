@@ -1,9 +1,11 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
+
+import datasets
+import interactive
+import regression
+import summaries
+import tables
 
 hide = """
         <style>
@@ -20,10 +22,7 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-crabs = pd.read_csv("crab-groups.csv")
-
-crabs.columns = ["Site", "Latitude", "Sample size", "Mean length", "Min length", "Max length", "Stdev length","Median length","Date"]
-crabs = crabs[["Site", "Date", "Sample size","Latitude","Mean length", "Min length", "Max length","Median length"]]
+crabs = datasets.load_crabs()
 
 thisdict = {
   "Mean length": "mean fiddler crab length",
@@ -52,36 +51,20 @@ with tab1:
         X = crabs[['Latitude']].values.reshape(-1, 1)
         y = crabs[[target]].values.reshape(-1, 1)
 
-        # Logistic regression predicting diagnosis from tumor radius
-        linearModel = LinearRegression()
-        linearModel.fit(X,np.ravel(y.astype(float)))
+        # Sums of latitude and the target, from which every tab's line, errors
+        # and correlation are computed
+        stats = regression.sufficient_stats("crabs", "Latitude", target)
+        fit = stats.fit()
 
         # regModeleq = st.checkbox("Display regression equation")
         add_reg = st.checkbox("Add regression line")
         add_resid = st.checkbox("Add residuals", disabled=(not add_reg))
         add_mean = st.checkbox("Add mean")
 
-        m, b = np.polyfit(np.ravel(X).astype(float), np.ravel(y).astype(float), 1)
-        m = np.round(m,3)
-        b = np.round(b,3)
+        m, b = fit.rounded(3)
 
     with col2:
-        fig, ax = plt.subplots()
-        sns.scatterplot(x="Latitude", y=target, data=crabs)
-        if add_reg:
-            plt.plot([X.min(),X.max()],[m*X.min()+b, m*X.max()+b,], color="red",label="Regression line")
-            plt.legend()
-        ax.set_xlabel("Latitude", fontsize=14)
-        ax.set_ylabel(target, fontsize=14)
-
-        if add_mean:
-            plt.axhline(y=y.mean() , color='darkorange', linewidth=2, label="Mean", linestyle=':')
-            plt.legend()
-
-        if add_resid:
-            n = len(X)
-            for i in range(len(X)):
-                plt.plot([X[i],X[i]],[y[i],m*X[i]+b],color='grey',linewidth = 2)
+        fig = regression.regression_plot(crabs, "Latitude", target, fit.rounded(3), add_reg, add_resid, add_mean)
 
         st.subheader("Plot")
         st.pyplot(fig)
@@ -99,29 +82,34 @@ with tab1:
             st.latex("\overline{\\text{" + target + "}} = " + str(np.round(crabs[target].mean(),2))+ ".")
 
 with tab2:
-    st.table(crabs[["Site","Date","Sample size","Latitude",target]])
+    tables.paged_dataframe(crabs[["Site","Date","Sample size","Latitude",target]], key="crabs", static=True)
 
 with tab3:
     st.subheader("Regression equation")
     st.latex("\widehat{\\text{" + target + "}} = " + str(m) + "(\\text{Latitude})" + str(b))
     st.subheader("Prediction")
     pred_text = "Move slider to find the predicted " + thisdict[target] + " when the latitude is"
-    predictor = st.slider(pred_text,30.0, 43.0, 30.0, 0.1)
-    prediction = np.round(m*predictor+b,2)
-    st.latex("\widehat{\\text{" + target + "}} (" + str(predictor) + ") = " + str(m) + "(" + str(predictor) + ")" + str(b) + " = " + str(prediction))
+    if st.toggle("Interactive chart", help="Move the latitude under the chart, without reloading the page."):
+        st.write(pred_text + " shown under the chart.")
+        # Latitudes offered by the slider
+        predictors = np.round(np.arange(30.0, 43.0 + 1e-9, 0.1), 1)
+        st.plotly_chart(interactive.predictions(X, y, m, b, predictors, 30.0, "Latitude", target))
+    else:
+        predictor = st.slider(pred_text,30.0, 43.0, 30.0, 0.1)
+        prediction = np.round(m*predictor+b,2)
+        st.latex("\widehat{\\text{" + target + "}} (" + str(predictor) + ") = " + str(m) + "(" + str(predictor) + ")" + str(b) + " = " + str(prediction))
 
 with tab4:
     st.subheader("Summary statistics")
-    st.table(crabs[["Latitude",target]].describe().T)
+    st.table(summaries.summary_cube("crabs").describe_columns(["Latitude",target]).T)
     st.subheader("Sum of squared errors")
-    yPredicted = m*X + b
-    SSEreg = np.round(sum((y - yPredicted)**2)[0],2)
-    SSEyBar = np.round(sum((y - np.mean(y))**2)[0],2)
+    SSEreg = np.round(stats.sse(fit.rounded(3)),2)
+    SSEyBar = np.round(stats.sse_mean(),2)
     ss_desc1 = "The sum of squared errors for the mean of the " + thisdict[target] + " is " + str(SSEyBar) + ". "
     ss_desc2 = "The sum of squared errors for the least squares regression line is " + str(SSEreg) + ". "
     ss_desc = ss_desc1 + ss_desc2
     st.write(ss_desc)
     st.subheader("Correlation coefficient")
-    corr = np.round(np.corrcoef(crabs["Latitude"], crabs[target])[0,1],2)
+    corr = np.round(stats.r,2)
     st.write("The correlation coefficient between latitude and " + thisdict[target] + " is " + str(corr) + ", which implies a strong positive correlation. ")
     st.write("The coefficient of determination is " + str(corr**2) + ", which means that " + str(corr**2*100) + "% of the variance in " + thisdict[target] + " can be explained by the variation in latitude using the least squares regression line.")
@@ -1,11 +1,12 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn import metrics, svm
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
+
+import datasets
+import lazy
+import models
+
+sns = lazy.module("seaborn")
+plt = lazy.module("matplotlib.pyplot")
 
 hide = """
         <style>
@@ -19,17 +20,14 @@ hide = """
         """
 st.markdown(hide, unsafe_allow_html=True)
 
-WBCD = pd.read_csv("WisconsinBreastCancerDatabase.csv")
-WBCD.loc[WBCD['Diagnosis']=='B','Diagnosis']=0
-WBCD.loc[WBCD['Diagnosis']=='M','Diagnosis']=1
+WBCD = datasets.load_wbcd()
 
 # Store relevant columns as variables
 X = WBCD[['Radius mean']].values.reshape(-1, 1)
 y = WBCD[['Diagnosis']].values.reshape(-1, 1).astype(int)
 
 #Logistic regression predicting diagnosis from tumor radius
-logisticModel = LogisticRegression()
-logisticModel.fit(X,np.ravel(y.astype(int)))
+logisticModel = models.fit_logistic(X, np.ravel(y))
 
 col1, col2 = st.columns([1,3])
 
@@ -51,7 +49,7 @@ with col2:
     fig, ax = plt.subplots()
     x = [X.min(),X.max()]
     y_val = [cutoff, cutoff]
-    x_val = (np.log(cutoff/(1-cutoff))+15.120902)/1.02475609
+    x_val = models.logistic_boundary(logisticModel, cutoff)
     plt.scatter(X,y)
     plt.plot(x, y_val, color='gray', linewidth=3)
     plt.plot([x_val,x_val],[0,1], color='gray', linewidth=3)
@@ -59,9 +57,7 @@ with col2:
     # plt.text(X.min()+2,cutoff-0.1,"TN", fontsize="large")
     # plt.text(X.max()-2,cutoff+0.1,"TP", fontsize="large")
     # plt.text(X.max()-2,cutoff-0.1,"FP", fontsize="large")
-    xDelta = np.linspace(X.min(),X.max(),10000)
-    yPredicted = logisticModel.predict(X).reshape(-1,1).astype(int)
-    yDeltaProb = logisticModel.predict_proba(xDelta.reshape(-1,1))[:,1]
+    xDelta, yDeltaProb = models.logistic_curve(logisticModel, X.min(), X.max())
     plt.plot(xDelta,yDeltaProb, color='red')
     ax.set_xlabel('Radius mean',fontsize=14);
     ax.set_ylabel('Probability of malignant tumor',fontsize=14);
@@ -0,0 +1,99 @@
+"""
+Cached model fitting shared by the apps.
+
+Fitted models are kept in st.cache_resource, keyed by a fingerprint of the
+training data and the hyperparameters, so all sessions reuse the same fit and
+widgets that do not affect the model never trigger a refit.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import streamlit as st
+
+import datasets
+import lazy
+from thresholds import ThresholdTable
+
+cluster = lazy.module("sklearn.cluster")
+linear_model = lazy.module("sklearn.linear_model")
+
+
+@st.cache_resource(show_spinner=False)
+def _fit_logistic(data_fingerprint, params, _X, _y):
+    # Arguments starting with an underscore are not hashed by Streamlit, the
+    # data is identified by data_fingerprint instead.
+    return linear_model.LogisticRegression(**dict(params)).fit(_X, _y)
+
+
+def fit_logistic(X, y, **params):
+    """
+    Returns a LogisticRegression fitted on X and y, shared across sessions.
+    The returned model must not be refitted or modified.
+    """
+    return _fit_logistic(datasets.fingerprint(X, y), tuple(sorted(params.items())), X, y)
+
+
+def logistic_boundary(model, cutoff):
+    """
+    Returns the feature value at which a single-feature logistic model's
+    predicted probability equals cutoff, or nan if the model's coefficient is
+    zero and the probability does not depend on the feature.
+    """
+    w = model.coef_[0, 0]
+    if w == 0:
+        return np.nan
+    return (np.log(cutoff / (1 - cutoff)) - model.intercept_[0]) / w
+
+
+def logistic_curve(model, x_min, x_max, n=200, tail=0.001):
+    """
+    Returns (x, probability) points on a single-feature logistic model's
+    probability curve between x_min and x_max.
+
+    The points are spaced evenly in probability rather than in x, so they are
+    dense around the transition and sparse on the flat tails, where the curve
+    is drawn as a straight line to x_min and x_max. A model with a zero
+    coefficient has a flat curve, which is sampled evenly in x instead.
+    """
+    w = model.coef_[0, 0]
+    b = model.intercept_[0]
+    if w == 0:
+        x = np.linspace(x_min, x_max, n)
+    else:
+        p = np.linspace(tail, 1 - tail, n)
+        x = (np.log(p / (1 - p)) - b) / w
+        x = np.sort(np.r_[x_min, x[(x > x_min) & (x < x_max)], x_max])
+    return x, 1 / (1 + np.exp(-(w * x + b)))
+
+
+@st.cache_resource(show_spinner=False)
+def _logistic_thresholds(data_fingerprint, params, _X, _y):
+    model = _fit_logistic(data_fingerprint, params, _X, _y)
+    return ThresholdTable(_y, model.predict_proba(_X)[:, 1])
+
+
+def logistic_thresholds(X, y, **params):
+    """
+    Returns the ThresholdTable of the model fit_logistic(X, y, **params) scored
+    on its own training data.
+    """
+    return _logistic_thresholds(datasets.fingerprint(X, y), tuple(sorted(params.items())), X, y)
+
+
+@st.cache_resource(show_spinner=False)
+def _kmeans_bank(data_fingerprint, max_k, seed, _X):
+    def fit(k):
+        return cluster.KMeans(n_clusters=k, n_init=10, random_state=seed).fit(_X)
+
+    with ThreadPoolExecutor() as pool:
+        return dict(zip(range(1, max_k + 1), pool.map(fit, range(1, max_k + 1))))
+
+
+def kmeans_bank(X, max_k=5, seed=0):
+    """
+    Returns {k: fitted KMeans} for k = 1..max_k. The models are seeded, fitted
+    in parallel the first time and shared across sessions, so looking up a
+    different k never reruns the clustering.
+    """
+    return _kmeans_bank(datasets.fingerprint(X), max_k, seed, X)
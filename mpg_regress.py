@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import figures
+import plots
 
 hide = """
         <style>
@@ -19,9 +19,6 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-# Load dataset
-mpg = pd.read_csv("mpg.csv")
-
 # Functions for equation and correlation
 def show_eq(data):
     m, b = np.polyfit(data[0], data[1], 1)
@@ -43,45 +40,13 @@ with col1:
 
     input_feat = st.selectbox(
         "Input feature",
-        [
-            "MPG",
-            "Cylinders",
-            "Horsepower",
-            "Displacement",
-            "Weight",
-            "Acceleration",
-            "Model year"
-        ]
+        list(plots.MPG_COLUMNS)
     )
 
     output_feat = st.selectbox(
         "Output feature",
-        [
-            "MPG",
-            "Cylinders",
-            "Horsepower",
-            "Displacement",
-            "Weight",
-            "Acceleration",
-            "Model year"
-        ]
+        list(plots.MPG_COLUMNS)
     )
 
-dict = {
-  "MPG": "mpg",
-  "Cylinders": "cylinders",
-  "Horsepower": "horsepower",
-  "Displacement": "displacement",
-  "Weight": "weight",
-  "Acceleration": "acceleration",
-  "Model year": "model_year"
-}
-
 with col2:
-
-    fig, ax = plt.subplots()
-    ax = sns.regplot(x=dict[input_feat], y=dict[output_feat],
-        data=mpg, fit_reg=False, ci=None, line_kws={"color": "grey"})
-    ax.set_xlabel(input_feat, fontsize=14)
-    ax.set_ylabel(output_feat, fontsize=14)
-    st.pyplot(fig)
+    figures.show(plots.mpg_regress, "mpg", input_feat, output_feat)
@@ -1,9 +1,12 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-from sklearn.cluster import KMeans
+
+import datasets
+import lazy
+import models
+
+sns = lazy.module("seaborn")
+plt = lazy.module("matplotlib.pyplot")
 
 hide = """
         <style>
@@ -17,16 +20,17 @@ hide = """
         """
 st.markdown(hide, unsafe_allow_html=True)
 
-geyser = pd.read_csv("oldfaithful.csv")
+geyser = datasets.load_oldfaithful()
+
+MAX_CLUSTERS = 5
 
 col1, col2 = st.columns([1,3])
 
 with col1:
-    clust_num = st.slider('Clusters', 1, 5)
-    kmModel = KMeans(n_clusters = clust_num)
-    kmModel = kmModel.fit(geyser)
+    clust_num = st.slider('Clusters', 1, MAX_CLUSTERS)
+    kmModel = models.kmeans_bank(geyser[['Eruption', 'Waiting']].values, max_k=MAX_CLUSTERS)[clust_num]
     centroids = kmModel.cluster_centers_
-    clusters = kmModel.fit_predict(geyser[['Eruption', 'Waiting']])
+    clusters = kmModel.labels_
 
 with col2:
     fig, ax = plt.subplots()
@@ -48,13 +52,9 @@ with col2:
     desc1 = "Description: A scatter plot of the Old Faithful eruption data "
     if clust_num==1:
         desc2 = "with " + str(clust_num) + " cluster is shown. The centroid is located at " + str(cent_pts[0]) + ". "
-    if clust_num==2:
+    elif clust_num==2:
         desc2 = "with " + str(clust_num) + " clusters are shown. The centroids are located at " + str(cent_pts[0]) + " and " + str(cent_pts[1]) + "."
-    if clust_num==3:
-        desc2 = "with " + str(clust_num) + " clusters are shown. The centroids are located at " + str(cent_pts[0]) + ", " + str(cent_pts[1]) + ", and " + str(cent_pts[2]) + "."
-    if clust_num==4:
-        desc2 = "with " + str(clust_num) + " clusters are shown. The centroids are located at " + str(cent_pts[0]) + ", " + str(cent_pts[1]) + ", " + str(cent_pts[2]) + ", and " + str(cent_pts[3])+ "."
-    if clust_num==5:
-        desc2 = "with " + str(clust_num) + " clusters are shown. The centroids are located at " + str(cent_pts[0]) + ", " + str(cent_pts[1]) + ", " + str(cent_pts[2]) + ", " + str(cent_pts[3])+ ", and " + str(cent_pts[4])+ "."
+    else:
+        desc2 = "with " + str(clust_num) + " clusters are shown. The centroids are located at " + ", ".join(str(i) for i in cent_pts[:-1]) + ", and " + str(cent_pts[-1]) + "."
     desc = desc1 + desc2
     st.write(desc)
@@ -1,8 +1,10 @@
 import streamlit as st
 import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import datasets
+import figures
+import plots
 
 hide = """
         <style>
@@ -17,46 +19,25 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-penguins = sns.load_dataset('penguins')
-penguins.columns = ["species", "island", "bill_length_mm", "bill_depth_mm", "flipper_length_mm", "body_mass_g", "sex"]
+penguins = datasets.load_penguins()
 
 col1, col2 = st.columns([2,3])
 
 with col1:
     type = st.selectbox(
         "Bar chart type",
-        [
-            "Stacked",
-            "Grouped"
-        ]
+        plots.BAR_TYPES
     )
 
     grouping_1 = st.selectbox(
             "Categorical variable",
-            [
-                "species",
-                "island",
-                "sex"
-            ]
-        )
-
-    if (grouping_1=="species"):
-        grouping_2 = st.selectbox(
-            "Grouping",
-            ["island","sex"]
-        )
-
-    elif (grouping_1=="island"):
-        grouping_2 = st.selectbox(
-            "Grouping",
-            ["species","sex"]
+            plots.PENGUINS_CATEGORICAL
         )
 
-    elif (grouping_1=="sex"):
-        grouping_2 = st.selectbox(
-            "Grouping",
-            ["species","island"]
-        )
+    grouping_2 = st.selectbox(
+        "Grouping",
+        plots.other_options(plots.PENGUINS_CATEGORICAL, grouping_1)
+    )
 
     check = st.checkbox("Display cross tabulation")
 
@@ -65,11 +46,4 @@ with col1:
         st.dataframe(cross)
 
 with col2:
-    fig, ax = plt.subplots()
-    if type=="Stacked": sns.histplot(x=grouping_1, hue=grouping_2, data=penguins, shrink=.8, multiple="stack")
-    elif type=="Grouped": sns.histplot(x=grouping_1, hue=grouping_2, data=penguins, shrink=.8, multiple="dodge")
-
-    ax.set_xlabel(grouping_1, fontsize=14)
-    ax.set_ylabel("Count", fontsize=14)
-
-    st.pyplot(fig)
+    figures.show(plots.penguins_bars, "penguins", type, grouping_1, grouping_2)
@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import figures
+import plots
+import summaries
 
 hide = """
         <style>
@@ -16,8 +17,6 @@ hide = """
         """
 st.markdown(hide, unsafe_allow_html=True)
 
-penguins = sns.load_dataset('penguins')
-penguins.columns = ["species", "island", "bill_length_mm", "bill_depth_mm", "flipper_length_mm", "body_mass_g", "sex"]
 col1, col2 = st.columns([1,3])
 
 
@@ -29,23 +28,18 @@ with tab1:
     with col1:
         numerical = st.selectbox(
             "Numerical feature",
-            ["bill_length_mm", "bill_depth_mm", "flipper_length_mm", "body_mass_g"]
+            plots.PENGUINS_NUMERICAL
         )
 
         categorical = st.selectbox(
             "Categorical feature",
-            ["species", "island","sex"]
+            plots.PENGUINS_CATEGORICAL
         )
 
     with col2:
-        fig, ax = plt.subplots()
-        sns.kdeplot(x=numerical, data=penguins, hue=categorical)
-        ax.set_xlabel(numerical, fontsize=14)
-        ax.set_ylabel("Density", fontsize=14)
-        ax.ticklabel_format(style='plain', axis='y')
-        st.pyplot(fig)
+        figures.show(plots.penguins_density, "penguins", numerical, categorical)
 
 with tab2:
         st.subheader("Summary statistics")
-        summary = penguins[numerical].groupby(penguins[categorical]).describe()
+        summary = summaries.summary_cube("penguins").describe(numerical, categorical)
         st.dataframe(summary)
@@ -1,61 +1,50 @@
 import pandas as pd
-import seaborn as sns
 import streamlit as st
-from pandas.api.types import (
-    is_categorical_dtype,
-    is_datetime64_any_dtype,
-    is_numeric_dtype,
-    is_object_dtype,
-)
+
+import datasets
+import filters
+import tables
 
 
 remove_missing = st.checkbox("Remove missing data")
 
-def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def filter_dataframe(profiled: filters.ProfiledFrame) -> tuple[pd.DataFrame, tuple]:
     """
     Adds a UI on top of a dataframe to let viewers filter columns
     Args:
-        df (pd.DataFrame): Original dataframe
+        profiled (filters.ProfiledFrame): Original dataframe and its column profiles
     Returns:
         pd.DataFrame: Filtered dataframe
+        tuple: The active filters.Predicates
     """
     modify = st.checkbox("Add filters")
 
+    df = profiled.df
 
     if not modify:
-        return df
-
-    df = df.copy()
-
-    # Try to convert datetimes into a standard format (datetime, no timezone)
-    for col in df.columns:
-        if is_object_dtype(df[col]):
-            try:
-                df[col] = pd.to_datetime(df[col])
-            except Exception:
-                pass
-
-        if is_datetime64_any_dtype(df[col]):
-            df[col] = df[col].dt.tz_localize(None)
+        return df, ()
 
     modification_container = st.container()
 
+    predicates = []
+
     with modification_container:
         to_filter_columns = st.multiselect("Filter dataframe on", df.columns)
         for column in to_filter_columns:
+            profile = profiled.profiles[column]
             left, right = st.columns((1, 20))
             left.write("↳")
             # Treat columns with < 10 unique values as categorical
-            if is_categorical_dtype(df[column]) or df[column].nunique() < 10:
+            if profile.kind == "categorical":
                 user_cat_input = right.multiselect(
                     f"Values for {column}",
-                    df[column].unique(),
-                    default=list(df[column].unique()),
+                    profile.values,
+                    default=list(profile.values),
                 )
-                df = df[df[column].isin(user_cat_input)]
-            elif is_numeric_dtype(df[column]):
-                _min = float(df[column].min())
-                _max = float(df[column].max())
+                predicates.append(filters.Predicate(column, "isin", tuple(user_cat_input)))
+            elif profile.kind == "numeric":
+                _min = profile.minimum
+                _max = profile.maximum
                 step = (_max - _min) / 100
                 user_num_input = right.slider(
                     f"Values for {column}",
@@ -64,29 +53,28 @@ def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
                     (_min, _max),
                     step=step,
                 )
-                df = df[df[column].between(*user_num_input)]
-            elif is_datetime64_any_dtype(df[column]):
+                predicates.append(filters.Predicate(column, "between", tuple(user_num_input)))
+            elif profile.kind == "datetime":
                 user_date_input = right.date_input(
                     f"Values for {column}",
                     value=(
-                        df[column].min(),
-                        df[column].max(),
+                        profile.minimum,
+                        profile.maximum,
                     ),
                 )
                 if len(user_date_input) == 2:
                     user_date_input = tuple(map(pd.to_datetime, user_date_input))
                     start_date, end_date = user_date_input
-                    df = df.loc[df[column].between(start_date, end_date)]
+                    predicates.append(filters.Predicate(column, "between", (start_date, end_date)))
             else:
                 user_text_input = right.text_input(
                     f"Substring or regex in {column}",
                 )
                 if user_text_input:
-                    df = df[df[column].str.contains(user_text_input)]
+                    predicates.append(filters.Predicate(column, "contains", (user_text_input,)))
 
-    return df
+    return filters.apply_filters(profiled, predicates), tuple(predicates)
 
 
-df = sns.load_dataset('penguins')
-if remove_missing: df = df.dropna()
-st.dataframe(filter_dataframe(df))
+filtered, predicates = filter_dataframe(filters.profiled_dataset("penguins", dropna=remove_missing))
+tables.paged_dataframe(filtered, key="penguins", source=("penguins", datasets.version("penguins"), remove_missing, predicates))
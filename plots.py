@@ -0,0 +1,276 @@
+"""
+Figures drawn by the plotting apps.
+
+Each function takes the app's dataset followed by the app's widget values and
+returns a new matplotlib figure. The apps display them through figures.show,
+which caches the rendered image per combination of widget values.
+
+WIDGET_SPACES lists every combination of widget values an app can pass, so
+that figures can pre-render them when the warm-up mode is enabled.
+"""
+
+from itertools import product
+
+import datasets
+import lazy
+
+plt = lazy.module("matplotlib.pyplot")
+sns = lazy.module("seaborn")
+
+MPG_COLUMNS = {
+    "MPG": "mpg",
+    "Cylinders": "cylinders",
+    "Horsepower": "horsepower",
+    "Displacement": "displacement",
+    "Weight": "weight",
+    "Acceleration": "acceleration",
+    "Model year": "model_year"
+}
+
+
+def _appearance_order(df, *columns):
+    # datasets.categorize sorts categories, but seaborn plotted these columns
+    # in order of first appearance when they were strings.
+    return df.assign(**{
+        column: df[column].cat.set_categories(df[column].dropna().unique().tolist())
+        for column in dict.fromkeys(columns)
+    })
+
+
+def gapminder(gapminder, plot, numerical, continent):
+    df = gapminder[numerical].take(datasets.group_positions("gapminder", "Continent", continent))
+    fig, ax = plt.subplots()
+
+    if plot == "Box plot":
+        sns.boxplot(x=df, width=0.5, ax=ax)
+
+    elif plot == "Histogram":
+        sns.histplot(x=df, ax=ax)
+
+    elif plot == "Density plot":
+        sns.histplot(x=df, kde=True, ax=ax)
+
+    ax.set_xlabel(numerical, fontsize=14)
+    ax.ticklabel_format(style='plain', axis='x')
+
+    if plot=="Histogram": ax.set_ylabel("Count", fontsize=14)
+    if numerical=="Population": ax.tick_params(axis='x', labelrotation = 20)
+    if plot=="Density plot":
+        ax.set_ylabel("Count", fontsize=14)
+        ax.ticklabel_format(style='plain', axis='y')
+
+    return fig
+
+
+def country_complete(country, plot, numerical, continent):
+    df = country[numerical].take(datasets.group_positions("country_complete", "Continent", continent))
+    fig, ax = plt.subplots()
+
+    if plot == "Box plot":
+        sns.boxplot(x=df, width=0.5, ax=ax)
+
+    elif plot == "Histogram":
+        sns.histplot(x=df, ax=ax)
+
+    elif plot == "Density plot":
+        sns.histplot(x=df, kde=True, stat="density", ax=ax)
+
+    ax.set_xlabel(numerical, fontsize=14)
+    ax.ticklabel_format(style='plain', axis='x')
+
+    if plot=="Histogram": ax.set_ylabel("Count", fontsize=14)
+    if plot=="Density plot":
+        ax.set_ylabel("Density", fontsize=14)
+        ax.ticklabel_format(style='plain', axis='y')
+
+    return fig
+
+
+def country_bar(country, categorical):
+    country = _appearance_order(country, categorical)
+    fig, ax = plt.subplots()
+    sns.histplot(x=categorical, data=country, shrink=.8, ax=ax)
+    ax.set_xlabel(categorical, fontsize=14)
+    ax.set_ylabel("Count", fontsize=14)
+    return fig
+
+
+def country_prop(country, categorical):
+    country = _appearance_order(country, categorical)
+    fig, ax = plt.subplots()
+    sns.histplot(x=categorical, data=country, shrink=.8, stat="density", ax=ax)
+    ax.set_xlabel(categorical, fontsize=14)
+    ax.set_ylabel("Proportion", fontsize=14)
+    return fig
+
+
+def mpg_regress(mpg, input_feat, output_feat):
+    fig, ax = plt.subplots()
+    sns.regplot(x=MPG_COLUMNS[input_feat], y=MPG_COLUMNS[output_feat],
+        data=mpg, fit_reg=False, ci=None, line_kws={"color": "grey"}, ax=ax)
+    ax.set_xlabel(input_feat, fontsize=14)
+    ax.set_ylabel(output_feat, fontsize=14)
+    return fig
+
+
+def tips_plots(tips, plot, numerical, categorical):
+    fig, ax = plt.subplots()
+
+    if plot == "Violin plot":
+        sns.violinplot(x=categorical, y=numerical, data = tips, ax=ax)
+
+    elif plot == "Density plot":
+        sns.kdeplot(x=numerical, multiple="stack", hue=categorical, data = tips, ax=ax)
+
+    elif plot == "Strip plot":
+        sns.stripplot(x=categorical, y=numerical, data = tips, ax=ax)
+
+    elif plot == "Box plot":
+        sns.boxplot(x=categorical, y=numerical, data = tips, ax=ax)
+
+    else:
+        sns.swarmplot(x=categorical, y=numerical, data = tips, ax=ax)
+
+    if plot == "Density plot":
+        ax.set_xlabel(numerical, fontsize=14)
+        ax.set_ylabel("Density", fontsize=14)
+    else:
+        ax.set_xlabel(categorical, fontsize=14)
+        ax.set_ylabel(numerical, fontsize=14)
+
+    return fig
+
+
+def tips_bars(tips, type, categorical, group):
+    fig, ax = plt.subplots()
+    if type=="Stacked": sns.histplot(x=categorical, hue=group, data=tips, shrink=.8, multiple="stack", ax=ax)
+    elif type=="Grouped": sns.histplot(x=categorical, hue=group, data=tips, shrink=.8, multiple="dodge", ax=ax)
+
+    ax.set_xlabel(categorical, fontsize=14)
+    ax.set_ylabel("Count", fontsize=14)
+
+    return fig
+
+
+def tips_multi1(tips, plot, numerical, categorical, group):
+    fig, ax = plt.subplots()
+
+    if plot == "Violin plot":
+        sns.violinplot(x=categorical, y=numerical, hue=group, data = tips, ax=ax)
+
+    elif plot == "Strip plot":
+        sns.stripplot(x=categorical, y=numerical,  hue=group, data = tips, ax=ax)
+
+    elif plot == "Box plot":
+        sns.boxplot(x=categorical, y=numerical,  hue=group, data = tips, ax=ax)
+
+    else:
+        sns.swarmplot(x=categorical, y=numerical,  hue=group, data = tips, ax=ax)
+
+    ax.set_xlabel(categorical, fontsize=14)
+    ax.set_ylabel(numerical, fontsize=14)
+
+    return fig
+
+
+def tips_multi2(tips, hue, style):
+    fig, ax = plt.subplots()
+
+    sns.scatterplot(x="Total bill", y="Tip", data=tips,
+        hue=hue, style=style, ax=ax)
+
+    ax.set_xlabel("Total bill", fontsize=14)
+    ax.set_ylabel("Tip", fontsize=14)
+
+    return fig
+
+
+def penguins_scatter(penguins, numerical_1, numerical_2, grouping_1, grouping_2):
+    penguins = _appearance_order(penguins, grouping_1, grouping_2)
+    fig, ax = plt.subplots()
+    sns.scatterplot(x=numerical_1, y=numerical_2, hue=grouping_1, style=grouping_2, data = penguins, ax=ax)
+    ax.set_xlabel(numerical_1, fontsize=14)
+    ax.set_ylabel(numerical_2, fontsize=14)
+    return fig
+
+
+def penguins_bars(penguins, type, grouping_1, grouping_2):
+    penguins = _appearance_order(penguins, grouping_1, grouping_2)
+    fig, ax = plt.subplots()
+    if type=="Stacked": sns.histplot(x=grouping_1, hue=grouping_2, data=penguins, shrink=.8, multiple="stack", ax=ax)
+    elif type=="Grouped": sns.histplot(x=grouping_1, hue=grouping_2, data=penguins, shrink=.8, multiple="dodge", ax=ax)
+
+    ax.set_xlabel(grouping_1, fontsize=14)
+    ax.set_ylabel("Count", fontsize=14)
+
+    return fig
+
+
+def penguins_density(penguins, numerical, categorical):
+    penguins = _appearance_order(penguins, categorical)
+    fig, ax = plt.subplots()
+    sns.kdeplot(x=numerical, data=penguins, hue=categorical, ax=ax)
+    ax.set_xlabel(numerical, fontsize=14)
+    ax.set_ylabel("Density", fontsize=14)
+    ax.ticklabel_format(style='plain', axis='y')
+    return fig
+
+
+def penguins_box(penguins, numerical, categorical):
+    penguins = _appearance_order(penguins, categorical)
+    fig, ax = plt.subplots()
+    sns.boxplot(x=numerical, data=penguins, y=categorical, ax=ax)
+    ax.set_xlabel(numerical, fontsize=14)
+    ax.set_ylabel(categorical, fontsize=14)
+    ax.ticklabel_format(style='plain', axis='x')
+    return fig
+
+
+def other_options(options, chosen):
+    """
+    Returns options without chosen, for a second selectbox that must pick a
+    different value than the first.
+    """
+    return [option for option in options if option != chosen]
+
+
+def _pairs(options):
+    return [(a, b) for a in options for b in other_options(options, a)]
+
+
+# Selectbox options of the apps, shared with WIDGET_SPACES so the warm-up
+# renders exactly the combinations the apps can ask for.
+DISTRIBUTION_PLOTS = ["Box plot", "Density plot", "Histogram"]
+BAR_TYPES = ["Stacked", "Grouped"]
+GAPMINDER_NUMERICAL = ["GDP per capita", "Life expectancy", "Population"]
+GAPMINDER_CONTINENTS = ["Africa", "Americas", "Asia", "Europe"]
+COUNTRY_NUMERICAL = ["Years", "Fertility", "Emissions", "Internet"]
+COUNTRY_CONTINENTS = ["Africa", "Americas", "Asia", "Europe", "Oceania"]
+COUNTRY_CATEGORICAL = ["Continent", "Internet access", "Emissions range"]
+TIPS_PLOTS = ["Box plot", "Density plot", "Violin plot", "Strip plot", "Swarm plot"]
+TIPS_GROUPED_PLOTS = ["Box plot", "Violin plot", "Strip plot", "Swarm plot"]
+TIPS_NUMERICAL = ["Tip", "Total bill"]
+TIPS_CATEGORICAL = ["Day", "Party size", "Time", "Sex", "Smoker"]
+PENGUINS_NUMERICAL = ["bill_length_mm", "bill_depth_mm", "flipper_length_mm", "body_mass_g"]
+PENGUINS_CATEGORICAL = ["species", "island", "sex"]
+
+WIDGET_SPACES = {
+    "gapminder": list(product(DISTRIBUTION_PLOTS, GAPMINDER_NUMERICAL, GAPMINDER_CONTINENTS)),
+    "country_complete": list(product(DISTRIBUTION_PLOTS, COUNTRY_NUMERICAL, COUNTRY_CONTINENTS)),
+    "country_bar": [(c,) for c in COUNTRY_CATEGORICAL],
+    "country_prop": [(c,) for c in COUNTRY_CATEGORICAL],
+    "mpg_regress": list(product(MPG_COLUMNS, MPG_COLUMNS)),
+    "tips_plots": list(product(TIPS_PLOTS, TIPS_NUMERICAL, TIPS_CATEGORICAL)),
+    "tips_bars": [(t,) + pair for t in BAR_TYPES for pair in _pairs(TIPS_CATEGORICAL)],
+    "tips_multi1": [
+        (p, n) + pair
+        for p in TIPS_GROUPED_PLOTS
+        for n in TIPS_NUMERICAL
+        for pair in _pairs(TIPS_CATEGORICAL)
+    ],
+    "tips_multi2": _pairs(TIPS_CATEGORICAL),
+    "penguins_scatter": [a + b for a in _pairs(PENGUINS_NUMERICAL) for b in _pairs(PENGUINS_CATEGORICAL)],
+    "penguins_bars": [(t,) + pair for t in BAR_TYPES for pair in _pairs(PENGUINS_CATEGORICAL)],
+    "penguins_density": list(product(PENGUINS_NUMERICAL, PENGUINS_CATEGORICAL)),
+    "penguins_box": list(product(PENGUINS_NUMERICAL, PENGUINS_CATEGORICAL)),
+}
@@ -0,0 +1,110 @@
+"""
+Reports how long each app spends importing modules before it can draw
+anything:
+
+    python profile_imports.py                 # every page of streamlit_app.py
+    python profile_imports.py wbcd.py tips_plots.py
+
+Each app's top-level import statements are run in a fresh interpreter with
+`python -X importtime`, and the cumulative time is reported in total and per
+top-level package. Modules the interpreter imports at startup (site,
+encodings, ...) are left out. Only the import statements are timed: loading data and
+other work done at module level is not included, and modules loaded through
+lazy.py only count where they are first used, so they do not show up here.
+"""
+
+import ast
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Packages listed in the per-app breakdown.
+TOP = 5
+
+# Seconds before an app's imports are given up on.
+TIMEOUT = 120
+
+
+def app_paths():
+    """
+    Returns the paths of the pages of streamlit_app.py, in the order they are
+    listed there.
+    """
+    path = os.path.join(HERE, "streamlit_app.py")
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    # The script runs st.navigation when imported, so read the st.Page calls instead.
+    return [
+        os.path.join(HERE, node.args[0].value)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "Page"
+        and node.args and isinstance(node.args[0], ast.Constant)
+    ]
+
+
+def import_statements(path):
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def _import_times(code):
+    # Returns [(top-level module, cumulative seconds)] for the top-level
+    # entries of `python -X importtime -c code`.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=HERE, capture_output=True, text=True, timeout=TIMEOUT,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Only top-level entries; nested imports are already included in them.
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        times.append((name.strip(), int(cumulative) / 1e6))
+    return times
+
+
+def startup_modules():
+    """
+    Returns the names of the modules imported by the interpreter itself before
+    any code runs.
+    """
+    return {name for name, _ in _import_times("pass")}
+
+
+def profile(path, startup=frozenset()):
+    """
+    Returns {top-level package: cumulative import time in seconds} for the
+    imports at the top of the app at path, or None if they time out. Modules
+    in startup are not counted.
+    """
+    try:
+        entries = _import_times(import_statements(path))
+    except subprocess.TimeoutExpired:
+        return None
+    times = defaultdict(float)
+    for name, seconds in entries:
+        if name not in startup:
+            times[name.split(".")[0]] += seconds
+    return dict(times)
+
+
+if __name__ == "__main__":
+    paths = [os.path.join(HERE, arg) for arg in sys.argv[1:]] or app_paths()
+    print("Time spent in each app's top-level import statements, not module-level code.")
+    startup = startup_modules()
+    for path in paths:
+        times = profile(path, startup)
+        if times is None:
+            print(f"{os.path.basename(path):28} timed out after {TIMEOUT}s")
+            continue
+        top = sorted(times.items(), key=lambda item: -item[1])[:TOP]
+        print(f"{os.path.basename(path):28} {sum(times.values()):6.2f}s  "
+              + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in top))
@@ -0,0 +1,181 @@
+"""
+Least-squares line fits and the regression figure of linear_regression.py.
+
+A (feature, target) pair is reduced once per dataset version to its
+SufficientStats: n, the means x̄ and ȳ, and the centered sums Σ(x - x̄)²,
+Σ(y - ȳ)² and Σ(x - x̄)(y - ȳ). The slope, intercept, correlation, R², both
+sums of squared errors and predictions all follow from those six numbers in
+constant time. Centering keeps them accurate when the values are large
+compared to their spread. Stats are computed chunk by chunk and merged, so a
+CSV file too large for memory can be summarized with csv_stats.
+
+The same LineFit is used for the plot, the equation, predictions and errors.
+Residuals are drawn as a single LineCollection instead of one line artist per
+point.
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import datasets
+import lazy
+
+plt = lazy.module("matplotlib.pyplot")
+sns = lazy.module("seaborn")
+mcollections = lazy.module("matplotlib.collections")
+
+
+class LineFit(NamedTuple):
+    slope: float
+    intercept: float
+
+    def predict(self, x):
+        return self.slope * np.asarray(x, dtype=float) + self.intercept
+
+    def rounded(self, decimals=3):
+        return LineFit(round(self.slope, decimals), round(self.intercept, decimals))
+
+
+# Rows summed at a time.
+CHUNK_ROWS = 100000
+
+
+class SufficientStats(NamedTuple):
+    n: int = 0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    # Σ(x - x̄)², Σ(y - ȳ)² and Σ(x - x̄)(y - ȳ)
+    m2_x: float = 0.0
+    m2_y: float = 0.0
+    c_xy: float = 0.0
+
+    @classmethod
+    def from_arrays(cls, x, y):
+        """
+        Returns the stats of the pairs (x[i], y[i]) where neither is missing.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        keep = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[keep], y[keep]
+        if len(x) == 0:
+            return cls()
+        mean_x, mean_y = x.mean(), y.mean()
+        dx, dy = x - mean_x, y - mean_y
+        return cls(len(x), float(mean_x), float(mean_y), float(dx @ dx), float(dy @ dy), float(dx @ dy))
+
+    def merge(self, other):
+        """
+        Returns the stats of both sets of pairs, using the pairwise update of
+        Chan et al. so that no large sums are subtracted.
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            return other
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        return SufficientStats(
+            n,
+            self.mean_x + dx * other.n / n,
+            self.mean_y + dy * other.n / n,
+            self.m2_x + other.m2_x + dx * dx * weight,
+            self.m2_y + other.m2_y + dy * dy * weight,
+            self.c_xy + other.c_xy + dx * dy * weight,
+        )
+
+    def fit(self):
+        slope = self.c_xy / self.m2_x
+        return LineFit(slope, self.mean_y - slope * self.mean_x)
+
+    @property
+    def r(self):
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+    @property
+    def r_squared(self):
+        return self.r ** 2
+
+    def sse_mean(self):
+        # The squared error of predicting every y by the mean
+        return self.m2_y
+
+    def sse(self, fit=None):
+        """
+        Returns Σ(y - (slope x + intercept))² for fit, by default the
+        least-squares line.
+        """
+        if fit is None:
+            return self.m2_y - self.c_xy ** 2 / self.m2_x
+        m, b = fit
+        # The error at the means, plus the error of the centered values.
+        offset = self.mean_y - m * self.mean_x - b
+        return self.m2_y - 2 * m * self.c_xy + m * m * self.m2_x + self.n * offset * offset
+
+
+def frame_stats(df, x, y, chunk_rows=CHUNK_ROWS):
+    stats = SufficientStats()
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        stats = stats.merge(SufficientStats.from_arrays(chunk[x], chunk[y]))
+    return stats
+
+
+def csv_stats(path, x, y, chunk_rows=CHUNK_ROWS):
+    """
+    Returns the SufficientStats of columns x and y of a CSV file, reading
+    chunk_rows rows at a time.
+    """
+    stats = SufficientStats()
+    for chunk in pd.read_csv(path, usecols=[x, y], chunksize=chunk_rows):
+        stats = stats.merge(SufficientStats.from_arrays(chunk[x], chunk[y]))
+    return stats
+
+
+@st.cache_resource(show_spinner=False)
+def _sufficient_stats(name, x, y, source_version):
+    return frame_stats(datasets.load(name), x, y)
+
+
+def sufficient_stats(name, x, y):
+    """
+    Returns the SufficientStats of columns x and y of a dataset, shared across
+    sessions.
+    """
+    return _sufficient_stats(name, x, y, datasets.version(name))
+
+
+def residual_segments(x, y, fit):
+    """
+    Returns an (n, 2, 2) array with one segment per point, from the point to
+    the fitted line.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return np.stack([np.column_stack([x, y]), np.column_stack([x, fit.predict(x)])], axis=1)
+
+
+def regression_plot(df, x, y, fit, add_reg=False, add_resid=False, add_mean=False):
+    fig, ax = plt.subplots()
+    sns.scatterplot(x=x, y=y, data=df, ax=ax)
+    x_min, x_max = df[x].min(), df[x].max()
+
+    if add_reg:
+        ax.plot([x_min, x_max], fit.predict([x_min, x_max]), color="red", label="Regression line")
+    if add_mean:
+        ax.axhline(y=df[y].mean(), color='darkorange', linewidth=2, label="Mean", linestyle=':')
+    if add_reg or add_mean:
+        ax.legend()
+    if add_resid:
+        ax.add_collection(mcollections.LineCollection(
+            residual_segments(df[x], df[y], fit), colors='grey', linewidths=2))
+
+    ax.set_xlabel(x, fontsize=14)
+    ax.set_ylabel(y, fontsize=14)
+    return fig
@@ -6,6 +6,10 @@ import streamlit as st
 import pandas as pd
 from mitosheet.streamlit.v1 import spreadsheet
 
+import exports
+import validation
+import workbooks
+
 st.set_page_config(layout="wide")
 
 
@@ -23,38 +27,40 @@ with col1:
     4. Once all of the checks pass, download the csv file.
     """)
 
+    # Workbooks in the data folder can also be opened here.
+    imported = workbooks.sheet_picker()
+
 
 CHECKS_AND_ERRORS = [
     # First column is issue date
-    (
-        lambda df: df.columns[0] != 'issue date',
-        'Please edit the first column name to "issue date".',
-        'You can do this by double clicking on the column name.'
+    validation.ColumnName(
+        0, "issue date",
+        message='Please edit the first column name to "issue date".',
+        help='You can do this by double clicking on the column name.'
     ),
     # Correct dtype
-    (
-        lambda df: df["issue date"].dtype != "datetime64[ns]",
-        'Please change the dtype of the "issue date" column to datetime.',
-        'You can do this by clicking on the Filter icon, and then selecting "datetime" from the "dtype" dropdown.'
-
+    validation.ColumnDtype(
+        "issue date", "datetime64[ns]",
+        message='Please change the dtype of the "issue date" column to datetime.',
+        help='You can do this by clicking on the Filter icon, and then selecting "datetime" from the "dtype" dropdown.'
     ),
     # No null values
-    (
-        lambda df: df["issue date"].isnull().sum() > 0,
-        'Please filter out all null values from the issue date column.',
-        'You can do this by clicking on the filter icon in the issue date column header, and adding an "Is Not Empty" filter.'
+    validation.NullCount(
+        "issue date",
+        message='Please filter out all null values from the issue date column.',
+        help='You can do this by clicking on the filter icon in the issue date column header, and adding an "Is Not Empty" filter.'
     ),
     # Delete the Notes column
-    (
-        lambda df: "Notes" in df.columns,
-        'Please delete the "Notes" column, which is the final column of the dataframe.',
-        'You can do this by selecting the column header and pressing the Delete key.'
+    validation.ColumnAbsent(
+        "Notes",
+        message='Please delete the "Notes" column, which is the final column of the dataframe.',
+        help='You can do this by selecting the column header and pressing the Delete key.'
     ),
     # Turn the term column into a number with the formula =VALUE(LEFT(term, 3))
-    (
-        lambda df: df["term"].dtype != "int64",
-        'Please extract the number of months from the "term" column.',
-        'To do so, double click on a cell in the column, and write the formula `=INT(LEFT(term, 3))`.'
+    validation.ColumnDtype(
+        "term", "int64",
+        message='Please extract the number of months from the "term" column.',
+        help='To do so, double click on a cell in the column, and write the formula `=INT(LEFT(term, 3))`.'
     ),
 ]
 
@@ -63,18 +69,14 @@ with col2:
         """
         Runs the data checks and displays prompts for the user to fix the data.
         """
-        for check, error_message, help in CHECKS_AND_ERRORS:
-            if check(df):
-                st.error(error_message + " " + help)
-                return False
+        failed = validation.first_failure(df, CHECKS_AND_ERRORS)
+        if failed is not None:
+            st.error(failed.message + " " + failed.help)
+            return False
         return True
 
-    @st.cache_data
-    def convert_df(df):
-        return df.to_csv(index=False).encode('utf-8')
-
     # Display the data inside of the spreadsheet so the user can easily fix data quality issues.
-    dfs, _ = spreadsheet(import_folder='./data')
+    dfs, _ = spreadsheet(*imported, import_folder='./data')
 
     # If the user has not yet imported data, prompt them to do so.
     if len(dfs) == 0:
@@ -91,12 +93,12 @@ with col2:
     if checks_passed:
         st.success("All checks passed! This data is clean, and ready to be downloaded.")
 
-        csv = convert_df(df)
+        format = st.radio("Format", list(exports.FORMATS), horizontal=True)
 
-        st.download_button(
+        exports.download_button(
             "Press to Download",
-            csv,
-            "mito_verified_data.csv",
-            "text/csv",
+            df,
+            "mito_verified_data",
+            format,
             key='download-csv'
         )
@@ -0,0 +1,46 @@
+"""
+Runs every app in this repository as a page of one multipage app:
+
+    streamlit run streamlit_app.py
+
+All pages share one process, so each dataset is loaded once (see datasets.py)
+and each library is imported once, however many pages are open. The apps can
+still be run on their own, e.g. `streamlit run tips_plots.py`.
+"""
+
+import streamlit as st
+
+PAGES = {
+    "Describing data": [
+        st.Page("tips_plots.py", title="Tips: one variable by group", default=True),
+        st.Page("tips_bars.py", title="Tips: two categorical variables"),
+        st.Page("tips_multi1.py", title="Tips: three variables"),
+        st.Page("tips_multi2.py", title="Tips: scatter plot by group"),
+        st.Page("penguins_1.py", title="Penguins: scatter plot"),
+        st.Page("penguins_2.py", title="Penguins: bar charts"),
+        st.Page("penguins_3.py", title="Penguins: density plots"),
+        st.Page("penguins_4.py", title="Penguins: box plots"),
+        st.Page("penguins_5.py", title="Penguins: filtering"),
+        st.Page("gapminder.py", title="Gapminder"),
+        st.Page("country_complete.py", title="Country: numerical variables"),
+        st.Page("country_bar.py", title="Country: counts"),
+        st.Page("country_prop.py", title="Country: proportions"),
+        st.Page("country_test.py", title="Country: group means"),
+        st.Page("country_manip.py", title="Country: table"),
+    ],
+    "Modeling": [
+        st.Page("mpg_regress.py", title="MPG regression"),
+        st.Page("linear_regression.py", title="Linear regression"),
+        st.Page("logistic_regression.py", title="Logistic regression"),
+        st.Page("wbcd.py", title="Breast cancer classification"),
+        st.Page("oldfaithful.py", title="Old Faithful clustering"),
+        st.Page("tangent_intuition.py", title="Secant and tangent lines"),
+    ],
+    "Accounting": [
+        st.Page("adjusting_entries.py", title="Adjusting entries"),
+        st.Page("adjusting_entries_excel.py", title="Adjusting entries in a spreadsheet"),
+        st.Page("spreadsheets.py", title="Data cleaning verification"),
+    ],
+}
+
+st.navigation(PAGES).run()
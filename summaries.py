@@ -0,0 +1,60 @@
+"""
+Grouped summary statistics computed once per dataset version.
+
+A SummaryCube holds describe() output (count, mean, std, min, quartiles and
+max) for every numerical column, overall and grouped by every categorical
+column, so the summary tabs of the apps are served by lookup instead of
+regrouping the data on each rerun.
+"""
+
+import streamlit as st
+
+import datasets
+
+# Columns with at most this many distinct values are used as groupings.
+MAX_GROUPS = 50
+
+
+class SummaryCube:
+    def __init__(self, df):
+        self.numerical = list(df.select_dtypes("number").columns)
+        self.categorical = [
+            column for column in df.columns
+            if df[column].dtype.kind != "f" and df[column].nunique() <= MAX_GROUPS
+        ]
+        self._overall = df[self.numerical].describe()
+        self._grouped = {
+            categorical: df.groupby(categorical, observed=False)[self.numerical].describe()
+            for categorical in self.categorical
+        }
+
+    def describe_columns(self, numerical):
+        """
+        Returns df[numerical].describe().
+        """
+        return self._overall[numerical].copy()
+
+    def describe(self, numerical, categorical):
+        """
+        Returns df.groupby(categorical)[numerical].describe().
+        """
+        return self._grouped[categorical][numerical].copy()
+
+    def describe_group(self, categorical, value):
+        """
+        Returns df[df[categorical] == value].describe().
+        """
+        row = self._grouped[categorical].loc[value]
+        return row.unstack(0)[self.numerical].reindex(row.index.unique(1))
+
+
+@st.cache_resource(show_spinner=False)
+def _summary_cube(name, dataset_version):
+    return SummaryCube(datasets.load(name))
+
+
+def summary_cube(name):
+    """
+    Returns the cached SummaryCube of one of the datasets in datasets.py.
+    """
+    return _summary_cube(name, datasets.version(name))
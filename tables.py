@@ -0,0 +1,75 @@
+"""
+Table display that only sends the visible window of a DataFrame.
+
+Tables longer than one page get pagination and sort controls. Sorting is done
+on the server and only the current page, plus a small prefetch margin of the
+next page's first rows, is serialized and sent to the browser, so scrolling
+past the end of a page does not need a page change. Tables that fit on one
+page are shown as they are.
+"""
+
+import streamlit as st
+
+PAGE_SIZE = 500
+PREFETCH = 50
+
+
+def sort_positions(values, descending):
+    """
+    Returns the positions of values in sorted order. The sort is stable in both
+    directions and missing values come last.
+    """
+    order = values.reset_index(drop=True).sort_values(
+        ascending=not descending, kind="stable", na_position="last"
+    )
+    return order.index.to_numpy()
+
+
+def _sort_positions(df, column, descending, key, source):
+    # The sort order is kept per table and reused while the same rows are
+    # shown with the same sort settings, e.g. when paging. Frames are often
+    # rebuilt on each rerun, so the rows are identified by source.
+    settings = (source, column, descending)
+    cached = st.session_state.get(key)
+    if source is not None and cached is not None and cached[0] == settings:
+        return cached[1]
+
+    positions = sort_positions(df[column], descending)
+    if source is not None:
+        st.session_state[key] = (settings, positions)
+    return positions
+
+
+def paged_dataframe(df, key, page_size=PAGE_SIZE, prefetch=PREFETCH, static=False, source=None):
+    """
+    Displays df with st.dataframe (or st.table if static) one page at a time.
+    key must be unique per table on the page.
+
+    source is a hashable value identifying the rows of df, such as the
+    dataset name and version and the selected group. When given, the sort
+    order is computed once and reused until source changes.
+    """
+    display = st.table if static else st.dataframe
+    if len(df) <= page_size:
+        display(df)
+        return
+
+    pages = -(-len(df) // page_size)
+    sort_col, order_col, page_col = st.columns([2, 1, 1])
+    column = sort_col.selectbox("Sort by", [None, *df.columns], key=f"{key}_sort")
+    descending = order_col.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order") == "Descending"
+    page = page_col.number_input(f"Page (of {pages})", 1, pages, 1, key=f"{key}_page")
+
+    start = (page - 1) * page_size
+    stop = min(start + page_size, len(df))
+    window = slice(start, min(stop + prefetch, len(df)))
+    if column is None:
+        rows = df.iloc[window]
+    else:
+        rows = df.take(_sort_positions(df, column, descending, f"{key}_positions", source)[window])
+
+    display(rows)
+    caption = f"Rows {start + 1:,}–{stop:,} of {len(df):,}"
+    if window.stop > stop:
+        caption += f", followed by the first {window.stop - stop:,} rows of the next page"
+    st.caption(caption)
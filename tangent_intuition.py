@@ -1,28 +1,50 @@
 import streamlit as st
 import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
-import sympy as sp
-from sympy import symbols, lambdify, sympify
+from typing import Callable, NamedTuple
 import warnings
+
+import interactive
+import lazy
+
+sns = lazy.module("seaborn")
+plt = lazy.module("matplotlib.pyplot")
+sp = lazy.module("sympy")
+
 warnings.filterwarnings('ignore')
 
+class CompiledFunction(NamedTuple):
+    f: Callable
+    df: Callable
+    latex: str
+    df_latex: str
+
+@st.cache_resource(show_spinner=False)
+def compile_function(func_str):
+    """
+    Compiles func_str and its derivative into numpy callables once per
+    expression string; sympify and lambdify are far slower than evaluating.
+    """
+    x = sp.symbols('x')
+    expr = sp.sympify(func_str)
+    der = expr.diff(x)
+    return CompiledFunction(
+        f=sp.lambdify(x, expr, 'numpy'),
+        df=sp.lambdify(x, der, 'numpy'),
+        latex=sp.latex(expr),
+        df_latex=sp.latex(der),
+    )
+
 def safe_eval_function(func_str, x_val):
     try:
-        x = symbols('x')
-        expr = sympify(func_str)
-        func = lambdify(x, expr, 'numpy')
-        return func(x_val)
+        return compile_function(func_str).f(x_val)
     except:
         return None
 
 def plot_function_with_secant_and_tangent(func_str, a, h, show_tangent):
-    x = symbols('x')
-    expr = sympify(func_str)
-    func = lambdify(x, expr, 'numpy')
+    compiled = compile_function(func_str)
 
     x_vals = np.linspace(a - 5, a + 5, 1000)
-    y_vals = func(x_vals)
+    y_vals = compiled.f(x_vals)
 
     x1, x2 = a, a + h
     y1 = safe_eval_function(func_str, x1)
@@ -35,9 +57,7 @@ def plot_function_with_secant_and_tangent(func_str, a, h, show_tangent):
 
     tan_slope = None
     if y1 is not None:
-        der = expr.diff(x)
-        der_func = lambdify(x, der, 'numpy')
-        tan_slope = der_func(a)
+        tan_slope = compiled.df(a)
         if show_tangent:
             y_tan = y1 + tan_slope * (x_vals - a)
 
@@ -104,6 +124,9 @@ a_val = st.sidebar.number_input(
     step=0.1,
     format="%.2f"
 )
+interactive_chart = st.sidebar.toggle("Interactive chart", help="Move h under the chart, without reloading the page.")
+# Values of h offered by the slider
+H_VALUES = np.round(np.arange(0.0, 2.0 + 1e-9, 0.01), 2)
 h_val = st.sidebar.slider(
     "Value of h:",
     min_value=0.0,
@@ -112,20 +135,31 @@ h_val = st.sidebar.slider(
     step=0.01,
     format="%.3f"
 )
+if interactive_chart:
+    st.sidebar.caption("The chart starts at this h. Its title shows the h and secant slope picked under it.")
 show_tan = st.sidebar.checkbox("Show tangent line at x = a", value=False)
 
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    fig = plot_function_with_secant_and_tangent(func_input, a_val, h_val, show_tan)
-    st.pyplot(fig)
+    if interactive_chart:
+        compiled = compile_function(func_input)
+        st.plotly_chart(interactive.secant_lines(compiled.f, compiled.df, a_val, H_VALUES, h_val, show_tan))
+    else:
+        fig = plot_function_with_secant_and_tangent(func_input, a_val, h_val, show_tan)
+        st.pyplot(fig)
 
     # detailed calculations below the graph
     y1 = safe_eval_function(func_input, a_val)
-    y2 = safe_eval_function(func_input, a_val + h_val)
+    sec_slope = None
+    # The interactive chart shows the secant for every h in its title, and the
+    # h picked under it is not sent back, so h-dependent text is left out.
+    if not interactive_chart:
+        y2 = safe_eval_function(func_input, a_val + h_val)
+        if y1 is not None and y2 is not None and h_val != 0:
+            sec_slope = (y2 - y1) / h_val
 
-    if y1 is not None and y2 is not None and h_val != 0:
-        sec_slope = (y2 - y1) / h_val
+    if sec_slope is not None:
         st.latex(
             rf"""\begin{{align*}}
 \frac{{f(a+h) - f(a)}}{{h}}
@@ -136,8 +170,7 @@ with col1:
         )
 
     if y1 is not None:
-        der = sympify(func_input).diff(symbols('x'))
-        der_func = lambdify(symbols('x'), der, 'numpy')
+        der_func = compile_function(func_input).df
         tan_slope = der_func(a_val)
         st.latex(
             rf"""\begin{{align*}}
@@ -150,10 +183,12 @@ with col1:
 with col2:
     st.subheader("Current Values")
     st.write(f"Function: f(x) = {selected}")
+    st.latex(rf"f'(x) = {compile_function(func_input).df_latex}")
     st.write(f"Point a: {a_val}")
-    st.write(f"Value h: {h_val}")
+    if not interactive_chart:
+        st.write(f"Value h: {h_val}")
 
-    if y1 is not None and y2 is not None and h_val != 0:
-        st.write(f"Secant slope: {(y2 - y1)/h_val:.6f}")
+    if sec_slope is not None:
+        st.write(f"Secant slope: {sec_slope:.6f}")
     if y1 is not None:
         st.write(f"Tangent slope: {der_func(a_val):.6f}")
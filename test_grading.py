@@ -0,0 +1,62 @@
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+import grading
+
+JOURNAL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "journal.xlsx")
+
+SALARIES = grading.KEYS["accrued_salaries"]
+
+
+def test_untouched_journal_fails_on_the_cells_to_fill():
+    journal = pd.read_excel(JOURNAL, engine="openpyxl")
+    grade = SALARIES.grade(journal)
+
+    # The cells the student leaves alone contain " ", which counts as blank.
+    assert grade.mistakes() == [(0, "account"), (0, "debit"), (1, "account"), (1, "credit")]
+    assert grade.extra_lines == 0
+    assert not grade.passed
+    assert grade.score == 0.5
+
+
+def test_correct_journal_passes():
+    journal = pd.DataFrame({
+        "Account Name": [" Salaries and Wages Expense", "Salaries and Wages Payable "],
+        "Debit": ["$800", " "],
+        "Credit": [None, "800.00"],
+    })
+    grade = SALARIES.grade(journal)
+
+    assert grade.mistakes() == []
+    assert grade.passed
+    assert grade.score == 1.0
+
+
+def test_extra_lines_are_counted_and_blank_lines_dropped():
+    journal = pd.DataFrame({
+        "Account Name": ["Salaries and Wages Expense", "Salaries and Wages Payable", " ", "Cash"],
+        "Debit": [800, np.nan, np.nan, 1200],
+        "Credit": [np.nan, 800, np.nan, np.nan],
+    })
+    grade = SALARIES.grade(journal)
+
+    assert grade.mistakes() == []
+    assert grade.extra_lines == 1
+    assert not grade.passed
+
+
+def test_amounts_with_symbols_and_dates_by_month_and_day():
+    key = grading.KEYS["accrued_electricity"]
+    journal = pd.DataFrame({
+        "Date": [datetime.date(2024, 9, 30), "9/30/2026"],
+        "Account": ["Electricity bill", "Accrued expenses"],
+        "Debit": ["$12,000", ""],
+        "Credit": ["", "12,000"],
+    })
+    assert key.grade(journal).passed
+
+    journal["Date"] = [datetime.date(2025, 9, 29), datetime.date(2025, 9, 30)]
+    assert key.grade(journal).mistakes() == [(0, "date")]
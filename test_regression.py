@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+import regression
+
+
+def test_stats_match_polyfit_for_large_offsets():
+    rng = np.random.default_rng(0)
+    x = 1e7 + rng.normal(size=1_000_000)
+    y = 2.5 * x + 3.0 + rng.normal(size=x.size)
+    df = pd.DataFrame({"x": x, "y": y})
+
+    # Several chunks, so the merged stats are tested too.
+    stats = regression.frame_stats(df, "x", "y", chunk_rows=300_000)
+    slope, intercept = np.polyfit(x, y, 1)
+    fit = stats.fit()
+
+    assert stats.n == x.size
+    np.testing.assert_allclose(fit.slope, slope, rtol=1e-9)
+    np.testing.assert_allclose(fit.predict(x.mean()), slope * x.mean() + intercept, rtol=1e-12)
+    np.testing.assert_allclose(stats.r, np.corrcoef(x, y)[0, 1], rtol=1e-9)
+
+    residuals = y - (slope * x + intercept)
+    np.testing.assert_allclose(stats.sse(), residuals @ residuals, rtol=1e-6)
+    np.testing.assert_allclose(stats.sse(regression.LineFit(slope, intercept)), residuals @ residuals, rtol=1e-6)
+    np.testing.assert_allclose(stats.sse_mean(), ((y - y.mean()) ** 2).sum(), rtol=1e-9)
+
+
+def test_missing_pairs_are_dropped():
+    stats = regression.SufficientStats.from_arrays([1.0, 2.0, np.nan, 4.0], [2.0, np.nan, 5.0, 8.0])
+    assert stats.n == 2
+    np.testing.assert_allclose(stats.fit(), (2.0, 0.0))
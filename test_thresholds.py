@@ -0,0 +1,39 @@
+import numpy as np
+from sklearn import metrics
+from sklearn.linear_model import LogisticRegression
+
+import datasets
+import thresholds
+
+
+def test_counts_match_sklearn_for_slider_cutoffs():
+    wbcd = datasets.load_wbcd()
+    X = wbcd[["Radius mean"]].to_numpy()
+    y = wbcd["Diagnosis"].to_numpy().astype(int)
+    scores = LogisticRegression().fit(X, y).predict_proba(X)[:, 1]
+    table = thresholds.ThresholdTable(y, scores)
+
+    # The cutoffs offered by the slider in wbcd.py.
+    for cutoff in np.round(np.arange(0.2, 0.8 + 1e-9, 0.01), 2):
+        predicted = (scores >= cutoff).astype(int)
+        tn, fp, fn, tp = metrics.confusion_matrix(y, predicted).ravel()
+        counts = table.counts(cutoff)
+
+        assert counts == (tp, fp, fn, tn)
+        assert counts.accuracy == metrics.accuracy_score(y, predicted)
+        assert counts.precision == metrics.precision_score(y, predicted, zero_division=0)
+        assert counts.recall == metrics.recall_score(y, predicted)
+
+    fpr, tpr = table.roc_curve()
+    np.testing.assert_allclose(np.trapezoid(tpr, fpr), metrics.roc_auc_score(y, scores))
+
+
+def test_tied_scores_change_counts_together():
+    y = [0, 1, 0, 1, 1]
+    scores = [0.2, 0.5, 0.5, 0.5, 0.9]
+    table = thresholds.ThresholdTable(y, scores)
+
+    assert table.counts(0.5) == (3, 1, 0, 1)
+    assert table.counts(0.51) == (1, 0, 2, 2)
+    fpr, tpr = table.roc_curve()
+    np.testing.assert_allclose(np.trapezoid(tpr, fpr), metrics.roc_auc_score(y, scores))
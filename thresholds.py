@@ -0,0 +1,87 @@
+"""
+Confusion-matrix counts for every probability cutoff of a binary classifier.
+
+The predicted probabilities are sorted once and cumulative positive/negative
+counts are stored, so the counts, accuracy, precision and recall for any
+cutoff come from a single binary search instead of reclassifying every row.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Counts(NamedTuple):
+    tp: int
+    fp: int
+    fn: int
+    tn: int
+
+    @property
+    def accuracy(self):
+        return (self.tp + self.tn) / (self.tp + self.fp + self.fn + self.tn)
+
+    @property
+    def precision(self):
+        # Matches sklearn, which reports 0 when nothing is predicted positive.
+        predicted = self.tp + self.fp
+        return self.tp / predicted if predicted else 0.0
+
+    @property
+    def recall(self):
+        actual = self.tp + self.fn
+        return self.tp / actual if actual else 0.0
+
+
+class ThresholdTable:
+    def __init__(self, y_true, y_score):
+        y_true = np.ravel(y_true).astype(bool)
+        y_score = np.ravel(y_score)
+        order = np.argsort(y_score, kind="mergesort")
+
+        self.scores = y_score[order]
+        # cum_pos[i] and cum_neg[i] count the positives and negatives among the
+        # i lowest scores, i.e. the rows predicted negative when i rows fall
+        # below the cutoff.
+        self.cum_pos = np.concatenate([[0], np.cumsum(y_true[order])])
+        self.cum_neg = np.concatenate([[0], np.cumsum(~y_true[order])])
+        self.n_pos = int(self.cum_pos[-1])
+        self.n_neg = int(self.cum_neg[-1])
+
+    def counts(self, cutoff):
+        """
+        Returns the confusion-matrix counts when rows with a score below
+        cutoff are predicted negative and all others positive.
+        """
+        i = np.searchsorted(self.scores, cutoff, side="left")
+        fn = int(self.cum_pos[i])
+        tn = int(self.cum_neg[i])
+        return Counts(tp=self.n_pos - fn, fp=self.n_neg - tn, fn=fn, tn=tn)
+
+    def _distinct_cutoffs(self):
+        # Every distinct score is a cutoff at which the counts change. Walking
+        # them from the highest down gives the curves in increasing recall.
+        starts = np.flatnonzero(np.r_[True, self.scores[1:] != self.scores[:-1]])
+        return starts[::-1]
+
+    def roc_curve(self):
+        """
+        Returns (false positive rate, true positive rate) over all cutoffs.
+        """
+        i = self._distinct_cutoffs()
+        tp = self.n_pos - self.cum_pos[i]
+        fp = self.n_neg - self.cum_neg[i]
+        fpr = np.r_[0.0, fp / max(self.n_neg, 1)]
+        tpr = np.r_[0.0, tp / max(self.n_pos, 1)]
+        return fpr, tpr
+
+    def pr_curve(self):
+        """
+        Returns (recall, precision) over all cutoffs.
+        """
+        i = self._distinct_cutoffs()
+        tp = self.n_pos - self.cum_pos[i]
+        fp = self.n_neg - self.cum_neg[i]
+        recall = tp / max(self.n_pos, 1)
+        precision = tp / np.maximum(tp + fp, 1)
+        return np.r_[0.0, recall], np.r_[1.0, precision]
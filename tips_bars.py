@@ -1,8 +1,10 @@
 import streamlit as st
 import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import datasets
+import figures
+import plots
 
 hide = """
         <style>
@@ -17,60 +19,25 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-tips = sns.load_dataset('tips')
-tips.columns = ["Total bill", "Tip", "Sex", "Smoker", "Day", "Time", "Party size"]
+tips = datasets.load_tips()
 
 col1, col2 = st.columns([2,3])
 
 with col1:
     type = st.selectbox(
         "Bar chart type",
-        [
-            "Stacked",
-            "Grouped"
-        ]
+        plots.BAR_TYPES
     )
 
     categorical = st.selectbox(
         "Categorical feature",
-        [
-            "Day",
-            "Party size",
-            "Time",
-            "Sex",
-            "Smoker"
-        ]
+        plots.TIPS_CATEGORICAL
     )
 
-    if categorical=="Day":
-            group = st.selectbox(
-                "Grouping",
-                ["Party size","Time","Sex","Smoker"]
-            )
-
-    elif categorical=="Party size":
-            group = st.selectbox(
-                "Grouping",
-                ["Day","Time","Sex","Smoker"]
-            )
-
-    elif categorical=="Time":
-            group = st.selectbox(
-                "Grouping",
-                ["Day","Party size","Sex","Smoker"]
-            )
-
-    elif categorical=="Sex":
-            group = st.selectbox(
-                "Grouping",
-                ["Day","Party size","Smoker","Time"]
-            )
-
-    else:
-            group = st.selectbox(
-                "Grouping",
-                ["Day","Party size","Sex","Time"]
-            )
+    group = st.selectbox(
+        "Grouping",
+        plots.other_options(plots.TIPS_CATEGORICAL, categorical)
+    )
 
     check = st.checkbox("Display cross tabulation")
 
@@ -79,11 +46,4 @@ with col1:
         st.dataframe(cross)
 
 with col2:
-    fig, ax = plt.subplots()
-    if type=="Stacked": sns.histplot(x=categorical, hue=group, data=tips, shrink=.8, multiple="stack")
-    elif type=="Grouped": sns.histplot(x=categorical, hue=group, data=tips, shrink=.8, multiple="dodge")
-
-    ax.set_xlabel(categorical, fontsize=14)
-    ax.set_ylabel("Count", fontsize=14)
-
-    st.pyplot(fig)
+    figures.show(plots.tips_bars, "tips", type, categorical, group)
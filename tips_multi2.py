@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
+
+import figures
+import plots
 
 hide = """
         <style>
@@ -17,60 +17,18 @@ hide = """
 
 st.markdown(hide, unsafe_allow_html=True)
 
-tips = sns.load_dataset('tips')
-tips.columns = ["Total bill", "Tip", "Sex", "Smoker", "Day", "Time", "Party size"]
-
 col1, col2 = st.columns([1,3])
 
 with col1:
     hue = st.selectbox(
         "Group by marker color",
-        [
-            "Day",
-            "Party size",
-            "Time",
-            "Sex",
-            "Smoker"
-        ]
+        plots.TIPS_CATEGORICAL
     )
 
-    if hue=="Day":
-            style = st.selectbox(
-                "Group by marker style",
-                ["Party size","Time","Sex","Smoker"]
-            )
-
-    elif hue=="Party size":
-            style = st.selectbox(
-                "Group by marker style",
-                ["Day","Time","Sex","Smoker"]
-            )
-
-    elif hue=="Time":
-            style = st.selectbox(
-                "Group by marker style",
-                ["Day","Party size","Sex","Smoker"]
-            )
-
-    elif hue=="Sex":
-            style = st.selectbox(
-                "Group by marker style",
-                ["Day","Party size","Smoker","Time"]
-            )
-
-    elif hue=="Smoker":
-            style = st.selectbox(
-                "Group by marker style",
-                ["Day","Party size","Sex","Time"]
-            )
+    style = st.selectbox(
+        "Group by marker style",
+        plots.other_options(plots.TIPS_CATEGORICAL, hue)
+    )
 
 with col2:
-    fig, ax = plt.subplots()
-
-    sns.scatterplot(x="Total bill", y="Tip", data=tips,
-        hue=hue, style=style)
-
-    ax.set_xlabel("Total bill", fontsize=14)
-    ax.set_ylabel("Tip", fontsize=14)
-
-    st.pyplot(fig)
+    figures.show(plots.tips_multi2, "tips", hue, style)
@@ -0,0 +1,105 @@
+"""
+Declarative data checks for the mitosheet apps.
+
+A check is a Rule with the message and help text shown when it fails. Each
+Rule subclass implements failed(df). Rules that only look at column names,
+dtypes or single cells are evaluated directly. Rules that scan column values
+(NullCount) are evaluated together, with one isna().sum() over every column
+they read.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, kw_only=True)
+class Rule(ABC):
+    message: str
+    help: str = ""
+
+    @abstractmethod
+    def failed(self, df):
+        """
+        Returns True if df breaks this rule.
+        """
+
+
+@dataclass(frozen=True)
+class ColumnName(Rule):
+    position: int
+    name: str
+
+    def failed(self, df):
+        return len(df.columns) <= self.position or df.columns[self.position] != self.name
+
+
+@dataclass(frozen=True)
+class ColumnAbsent(Rule):
+    column: str
+
+    def failed(self, df):
+        return self.column in df.columns
+
+
+@dataclass(frozen=True)
+class ColumnDtype(Rule):
+    column: str
+    dtype: str
+
+    def failed(self, df):
+        return self.column not in df.columns or df[self.column].dtype != self.dtype
+
+
+@dataclass(frozen=True)
+class CellValue(Rule):
+    row: int
+    position: int
+    value: Any
+
+    def failed(self, df):
+        rows, columns = df.shape
+        return self.row >= rows or self.position >= columns or df.iat[self.row, self.position] != self.value
+
+
+@dataclass(frozen=True)
+class NullCount(Rule):
+    column: str
+    # The most null values the column may contain.
+    maximum: int = 0
+
+    def failed(self, df):
+        return self.column not in df.columns or df[self.column].isna().sum() > self.maximum
+
+
+def null_counts(df, rules):
+    """
+    Returns the number of null values in each column of df that a NullCount
+    rule in rules reads.
+    """
+    columns = list(dict.fromkeys(
+        rule.column for rule in rules if isinstance(rule, NullCount) and rule.column in df.columns
+    ))
+    return df[columns].isna().sum().to_dict() if columns else {}
+
+
+def validate(df, rules):
+    """
+    Returns the rules that df fails, in the order they are given.
+    """
+    counts = null_counts(df, rules)
+    return [
+        rule for rule in rules
+        if (
+            rule.column not in counts or counts[rule.column] > rule.maximum
+            if isinstance(rule, NullCount) else rule.failed(df)
+        )
+    ]
+
+
+def first_failure(df, rules):
+    """
+    Returns the first rule that df fails, or None if every rule passes.
+    """
+    failed = validate(df, rules)
+    return failed[0] if failed else None
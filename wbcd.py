@@ -1,11 +1,13 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn import metrics, svm
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
+
+import datasets
+import interactive
+import lazy
+import models
+
+sns = lazy.module("seaborn")
+plt = lazy.module("matplotlib.pyplot")
 
 hide = """
         <style>
@@ -19,43 +21,48 @@ hide = """
         """
 st.markdown(hide, unsafe_allow_html=True)
 
-WBCD = pd.read_csv("WisconsinBreastCancerDatabase.csv")
-WBCD.loc[WBCD['Diagnosis']=='B','Diagnosis']=0
-WBCD.loc[WBCD['Diagnosis']=='M','Diagnosis']=1
+WBCD = datasets.load_wbcd()
 
 # Store relevant columns as variables
 X = WBCD[['Radius mean']].values.reshape(-1, 1)
 y = WBCD[['Diagnosis']].values.reshape(-1, 1).astype(int)
 
 #Logistic regression predicting diagnosis from tumor radius
-logisticModel = LogisticRegression()
-logisticModel.fit(X,np.ravel(y.astype(int)))
+logisticModel = models.fit_logistic(X, np.ravel(y))
 
 col1, col2 = st.columns([1,3])
 
+# Cutoffs offered by the slider
+CUTOFFS = np.round(np.arange(0.2, 0.8 + 1e-9, 0.01), 2)
+
+with col1:
+    interactive_chart = st.toggle("Interactive chart", help="Move the cutoff under the chart, without reloading the page.")
+
+if interactive_chart:
+    with col1:
+        st.write("Move the slider under the chart to change the probability cutoff. The accuracy, precision, recall and confusion matrix are shown above the chart.")
+    with col2:
+        st.plotly_chart(interactive.logistic_cutoffs(X, y, logisticModel, models.logistic_thresholds(X, np.ravel(y)),
+            CUTOFFS, 0.5, 'Radius mean', 'Probability of malignant tumor'))
+    st.stop()
+
 with col1:
     cutoff = st.slider('Probability cutoff',0.2, 0.8, 0.5,0.01)
-    yPredictedProb = logisticModel.predict_proba(X)[:,1]
-    yPredLowCutoff = []
-    for i in range(0,yPredictedProb.size):
-        if yPredictedProb[i] < cutoff:
-            yPredLowCutoff.append(0)
-        else:
-            yPredLowCutoff.append(1)
-    st.write("Accuracy: " + str(round(metrics.accuracy_score(y,yPredLowCutoff),2)))
-    st.write("Precision: " + str(round(metrics.precision_score(y,yPredLowCutoff),2)))
-    st.write("Recall: " + str(round(metrics.recall_score(y,yPredLowCutoff),2)))
-    st.write("TP: " + str(metrics.confusion_matrix(y,yPredLowCutoff)[0][0]))
-    st.write("FP: " + str(metrics.confusion_matrix(y,yPredLowCutoff)[0][1]))
-    st.write("FN: " + str(metrics.confusion_matrix(y,yPredLowCutoff)[1][0]))
-    st.write("TN: " + str(metrics.confusion_matrix(y,yPredLowCutoff)[1][1]))
+    counts = models.logistic_thresholds(X, np.ravel(y)).counts(cutoff)
+    st.write("Accuracy: " + str(round(counts.accuracy,2)))
+    st.write("Precision: " + str(round(counts.precision,2)))
+    st.write("Recall: " + str(round(counts.recall,2)))
+    st.write("TP: " + str(counts.tp))
+    st.write("FP: " + str(counts.fp))
+    st.write("FN: " + str(counts.fn))
+    st.write("TN: " + str(counts.tn))
 
 with col2:
     #Graph logistic regression probabilities
     fig, ax = plt.subplots()
     x = [X.min(),X.max()]
     y_val = [cutoff, cutoff]
-    x_val = (np.log(cutoff/(1-cutoff))+15.120902)/1.02475609
+    x_val = models.logistic_boundary(logisticModel, cutoff)
     plt.scatter(X,y)
     plt.plot(x, y_val, color='gray', linewidth=3)
     plt.plot([x_val,x_val],[0,1], color='gray', linewidth=3)
@@ -63,9 +70,7 @@ with col2:
     plt.text(X.min()+2,cutoff-0.1,"TN", fontsize="large")
     plt.text(X.max()-2,cutoff+0.1,"TP", fontsize="large")
     plt.text(X.max()-2,cutoff-0.1,"FP", fontsize="large")
-    xDelta = np.linspace(X.min(),X.max(),10000)
-    yPredicted = logisticModel.predict(X).reshape(-1,1).astype(int)
-    yDeltaProb = logisticModel.predict_proba(xDelta.reshape(-1,1))[:,1]
+    xDelta, yDeltaProb = models.logistic_curve(logisticModel, X.min(), X.max())
     plt.plot(xDelta,yDeltaProb, color='red')
     ax.set_xlabel('Radius mean',fontsize=14);
     ax.set_ylabel('Probability of malignant tumor',fontsize=14);
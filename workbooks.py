@@ -0,0 +1,98 @@
+"""
+Cached Excel workbook imports for the mitosheet apps.
+
+A workbook is parsed once, in openpyxl's streaming read-only mode with cached
+formula values, and the raw rows of every sheet are kept across sessions,
+keyed by the SHA-256 of the file. Choosing another sheet or number of rows to
+skip builds a frame from the stored rows without parsing the file again.
+"""
+
+import glob
+import hashlib
+import os
+
+import pandas as pd
+import streamlit as st
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def workbook_paths(folder=DATA_DIR):
+    return sorted(glob.glob(os.path.join(folder, "*.xlsx")))
+
+
+@st.cache_resource(show_spinner=False)
+def _file_hash(path, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key, so the file is hashed
+    # again after it changes.
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_hash(path):
+    stat = os.stat(path)
+    return _file_hash(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _trim(rows):
+    # Read-only worksheets report the stored dimensions, which often include
+    # trailing empty rows and columns.
+    while rows and all(value is None for value in rows[-1]):
+        rows.pop()
+    width = max((i + 1 for row in rows for i, value in enumerate(row) if value is not None), default=0)
+    return [row[:width] for row in rows]
+
+
+@st.cache_resource(show_spinner=False)
+def _sheets(digest, _path):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(_path, read_only=True, data_only=True)
+    try:
+        return {sheet.title: _trim(list(sheet.iter_rows(values_only=True))) for sheet in workbook}
+    finally:
+        workbook.close()
+
+
+def sheet_names(path):
+    return list(_sheets(file_hash(path), path))
+
+
+@st.cache_resource(show_spinner=False)
+def _frame(digest, sheet, skiprows, _path):
+    rows = _sheets(digest, _path)[sheet][skiprows:]
+    if not rows:
+        return pd.DataFrame()
+    header = [f"Unnamed: {i}" if name is None else str(name) for i, name in enumerate(rows[0])]
+    return pd.DataFrame(rows[1:], columns=header)
+
+
+def read_sheet(path, sheet=None, skiprows=0):
+    """
+    Returns one sheet of the workbook at path as a DataFrame, using the first
+    row after skiprows as the header. sheet defaults to the first sheet.
+
+    The frame is shared across sessions and must be treated as read-only.
+    """
+    digest = file_hash(path)
+    if sheet is None:
+        sheet = next(iter(_sheets(digest, path)))
+    return _frame(digest, sheet, skiprows, path)
+
+
+def sheet_picker(folder=DATA_DIR):
+    """
+    Shows widgets for opening a sheet of a workbook in folder, and returns the
+    frames to pass to mitosheet's spreadsheet(): the chosen sheet, or none if
+    no workbook is chosen.
+    """
+    workbook = st.selectbox("Workbook", workbook_paths(folder), index=None,
+        format_func=os.path.basename, placeholder="Import through the spreadsheet")
+    if workbook is None:
+        return []
+    sheet = st.selectbox("Sheet", sheet_names(workbook))
+    skiprows = st.number_input("Rows to skip", min_value=0, step=1)
+    return [read_sheet(workbook, sheet, skiprows)]